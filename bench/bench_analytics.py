@@ -0,0 +1,60 @@
+"""
+Benchmark the per-tap cost of copy analytics and the cost of a batched flush.
+
+Usage:
+    python bench/bench_analytics.py [--taps 100000] [--questions 100]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "bot"))
+
+from analytics import CopyAnalytics  # noqa: E402
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--taps", type=int, default=100_000)
+    parser.add_argument("--questions", type=int, default=100)
+    parser.add_argument("--days", type=int, default=7)
+    args = parser.parse_args()
+
+    start_day = date(2025, 12, 12)
+    taps = [
+        (random.randrange(args.questions), random.choice(("daily", "special")),
+         start_day + timedelta(days=random.randrange(args.days)))
+        for _ in range(args.taps)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        analytics = CopyAnalytics(Path(tmp) / "analytics.json")
+
+        started = time.perf_counter()
+        for question_id, kind, day in taps:
+            analytics.record(question_id, kind, day)
+        record_elapsed = time.perf_counter() - started
+        keys = analytics.pending
+
+        started = time.perf_counter()
+        analytics.flush()
+        first_flush = time.perf_counter() - started
+
+        for question_id, kind, day in taps[:1000]:
+            analytics.record(question_id, kind, day)
+        started = time.perf_counter()
+        analytics.flush()
+        merge_flush = time.perf_counter() - started
+
+    print(f"record: {record_elapsed / args.taps * 1e6:.2f} us/tap over {args.taps} taps")
+    print(f"flush:  {first_flush * 1000:.2f} ms for {keys} keys (one write)")
+    print(f"merge:  {merge_flush * 1000:.2f} ms for 1000 taps into existing store")
+
+
+if __name__ == "__main__":
+    main_cli()
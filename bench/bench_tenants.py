@@ -0,0 +1,76 @@
+"""
+Measure the memory cost of each extra bot hosted in the same process.
+
+Builds N Applications (handlers, update processor, analytics) against the
+shared question catalog and reports traced memory per extra bot, compared to
+the memory of the first bot plus the shared catalog.
+
+Usage:
+    BOT_TOKEN=dummy python bench/bench_tenants.py [--bots 10]
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "bot"))
+os.environ.setdefault("BOT_TOKEN", "benchmark")
+
+import main  # noqa: E402
+
+
+def make_tenant(data_dir: Path, index: int) -> dict:
+    name = f"bot{index}"
+    return {
+        "name": name,
+        "token": f"{100000 + index}:benchmark",
+        "web_url": main.config.WEB_URL,
+        "subscribers_path": data_dir / name / "subscribers.json",
+        "analytics_path": data_dir / name / "analytics.json",
+        "broadcast_path": data_dir / name / "broadcast.json",
+        "notification_hour": 19,
+        "notification_minute": 0,
+    }
+
+
+def traced() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bots", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tracemalloc.start()
+        baseline = traced()
+
+        main.load_questions()
+        main.get_today_payload(datetime.now())
+        catalog = traced() - baseline
+
+        handler_slots = asyncio.Semaphore(main.config.MAX_CONCURRENT_UPDATES)
+        applications = [main.build_application(make_tenant(Path(tmp), 0), handler_slots)]
+        first = traced() - baseline - catalog
+
+        before_extra = traced()
+        for i in range(1, args.bots):
+            applications.append(main.build_application(make_tenant(Path(tmp), i), handler_slots))
+        extra = (traced() - before_extra) / max(1, args.bots - 1)
+        tracemalloc.stop()
+
+    print(f"shared catalog + payload: {catalog / 1024:8.1f} KiB (once per process)")
+    print(f"first bot:                {first / 1024:8.1f} KiB")
+    print(f"each extra bot:           {extra / 1024:8.1f} KiB ({args.bots} bots)")
+
+
+if __name__ == "__main__":
+    main_cli()
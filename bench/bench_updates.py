@@ -0,0 +1,112 @@
+"""
+Benchmark update processing under a burst of simulated users.
+
+Each simulated /start does the real subscriber file I/O and then waits for two
+simulated reply_text round-trips. Reports commands/s and handler latency
+(time from the update arriving to its handler finishing) for sequential
+processing and for PerChatUpdateProcessor.
+
+Usage:
+    BOT_TOKEN=dummy python bench/bench_updates.py [--users 200] [--rtt-ms 80]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "bot"))
+os.environ.setdefault("BOT_TOKEN", "benchmark")
+
+from telegram import Chat, Message, Update  # noqa: E402
+from telegram.ext import SimpleUpdateProcessor  # noqa: E402
+
+import main  # noqa: E402
+from concurrency import PerChatUpdateProcessor  # noqa: E402
+
+
+def make_update(update_id: int, chat_id: int, text: str) -> Update:
+    message = Message(
+        message_id=update_id,
+        date=datetime.now(),
+        chat=Chat(id=chat_id, type="private"),
+        text=text,
+    )
+    return Update(update_id=update_id, message=message)
+
+
+async def simulated_handler(update: Update, rtt: float, arrived: float, latencies: list):
+    chat_id = update.effective_chat.id
+    if update.message.text == "/start":
+        main.add_subscriber(chat_id, f"user{chat_id}")
+        main.load_questions()
+        await asyncio.sleep(rtt)  # welcome reply_text
+        await asyncio.sleep(rtt)  # today's questions reply_text
+    else:
+        main.remove_subscriber(chat_id)
+        await asyncio.sleep(rtt)
+    latencies.append(time.perf_counter() - arrived)
+
+
+async def run_burst(processor, users: int, rtt: float) -> dict:
+    main.save_subscribers({"subscribers": [], "sent_log": []})
+    latencies = []
+    updates = []
+    for i in range(users):
+        updates.append(make_update(2 * i, chat_id=i, text="/start"))
+        updates.append(make_update(2 * i + 1, chat_id=i, text="/stop"))
+
+    async with processor:
+        started = time.perf_counter()
+        tasks = [
+            asyncio.create_task(processor.process_update(
+                u, simulated_handler(u, rtt, started, latencies)
+            ))
+            for u in updates
+        ]
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    remaining = len(main.load_subscribers()["subscribers"])
+    latencies.sort()
+    return {
+        "commands_per_s": len(updates) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "remaining_subscribers": remaining,
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--rtt-ms", type=float, default=80.0)
+    parser.add_argument("--max-concurrent", type=int, default=32)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        main.DATA_DIR = Path(tmp)
+        main.SUBSCRIBERS_PATH = Path(tmp) / "subscribers.json"
+        rtt = args.rtt_ms / 1000
+
+        runs = [
+            ("sequential", SimpleUpdateProcessor(1)),
+            (f"per-chat x{args.max_concurrent}", PerChatUpdateProcessor(args.max_concurrent)),
+        ]
+        print(f"{args.users} users, /start + /stop each, rtt={args.rtt_ms:.0f}ms")
+        for name, processor in runs:
+            result = asyncio.run(run_burst(processor, args.users, rtt))
+            print(
+                f"{name:>16}: {result['commands_per_s']:8.1f} cmd/s  "
+                f"p50={result['p50_ms']:8.1f}ms  p99={result['p99_ms']:8.1f}ms  "
+                f"left subscribed={result['remaining_subscribers']}"
+            )
+
+
+if __name__ == "__main__":
+    main_cli()
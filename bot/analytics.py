@@ -0,0 +1,140 @@
+"""
+Question copy analytics.
+Counts copy button taps in memory and flushes them to a JSON store in batches.
+
+Usage:
+    python analytics.py report [--since YYYY-MM-DD] [--until YYYY-MM-DD] [--csv]
+"""
+
+import argparse
+import csv
+import json
+import logging
+import sys
+from collections import Counter
+from datetime import date as date_type
+from pathlib import Path
+
+from storage import ANALYTICS_JSON_PATH, QUESTIONS_JSON_PATH, save_json_atomic
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("daily", "special")
+
+
+def load_store(path: Path) -> dict:
+    """Load the analytics store: {"copies": {date: {kind: {question_id: count}}}}."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"copies": {}}
+
+
+class CopyAnalytics:
+    """In-memory copy counters keyed by (date, question_id, kind)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._pending = Counter()
+
+    @property
+    def pending(self) -> int:
+        """Number of distinct keys waiting to be flushed."""
+        return len(self._pending)
+
+    def record(self, question_id: int, kind: str, date: date_type = None):
+        """Count one copy tap. Only touches memory."""
+        day = (date or date_type.today()).isoformat()
+        self._pending[(day, question_id, kind)] += 1
+
+    def flush(self) -> int:
+        """Merge pending counts into the store in one write. Returns taps flushed."""
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, Counter()
+        try:
+            data = load_store(self.path)
+            copies = data.setdefault("copies", {})
+            for (day, question_id, kind), count in pending.items():
+                by_kind = copies.setdefault(day, {}).setdefault(kind, {})
+                key = str(question_id)
+                by_kind[key] = by_kind.get(key, 0) + count
+            save_json_atomic(data, self.path)
+        except Exception:
+            # Keep the counts for the next flush
+            self._pending.update(pending)
+            raise
+
+        total = sum(pending.values())
+        logger.info(f"Analytics flushed: {total} copies, {len(pending)} keys")
+        return total
+
+
+def build_report(data: dict, since: str = None, until: str = None) -> list:
+    """Aggregate stored counts per (kind, question_id), most copied first."""
+    totals = Counter()
+    days = {}
+    for day, by_kind in data.get("copies", {}).items():
+        if (since and day < since) or (until and day > until):
+            continue
+        for kind, counts in by_kind.items():
+            for question_id, count in counts.items():
+                key = (kind, int(question_id))
+                totals[key] += count
+                days.setdefault(key, set()).add(day)
+
+    return [
+        {"kind": kind, "question_id": question_id, "copies": count,
+         "days": len(days[(kind, question_id)])}
+        for (kind, question_id), count in totals.most_common()
+    ]
+
+
+def load_question_texts(path: Path) -> dict:
+    """Map (kind, question_id) to question text for the report."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            questions = json.load(f).get("questions", {})
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return {
+        (kind, q.get("id")): q.get("text", "")
+        for kind in KINDS
+        for q in questions.get(kind, [])
+        if isinstance(q, dict)
+    }
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Question copy analytics")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    report = subparsers.add_parser("report", help="Per-question copy totals")
+    report.add_argument("--since", help="First date (YYYY-MM-DD), inclusive")
+    report.add_argument("--until", help="Last date (YYYY-MM-DD), inclusive")
+    report.add_argument("--csv", action="store_true", help="Write CSV to stdout")
+    report.add_argument("--store", type=Path, default=ANALYTICS_JSON_PATH)
+    report.add_argument("--questions", type=Path, default=QUESTIONS_JSON_PATH)
+    args = parser.parse_args(argv)
+
+    rows = build_report(load_store(args.store), args.since, args.until)
+    texts = load_question_texts(args.questions)
+    for row in rows:
+        row["text"] = texts.get((row["kind"], row["question_id"]), "")
+
+    if args.csv:
+        writer = csv.DictWriter(sys.stdout, fieldnames=["kind", "question_id", "copies", "days", "text"])
+        writer.writeheader()
+        writer.writerows(rows)
+        return
+
+    if not rows:
+        print("No copies recorded.")
+        return
+    for row in rows:
+        print(f"{row['copies']:6d}  {row['days']:4d}d  {row['kind']:<7} #{row['question_id']:<4} {row['text']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Concurrent update processing for the bot.
+Updates from different chats run in parallel, updates from the same chat run in order.
+"""
+
+import asyncio
+import inspect
+import logging
+from typing import Any, Awaitable, Optional
+
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+logger = logging.getLogger(__name__)
+
+
+def get_update_chat_id(update: object) -> Optional[int]:
+    """Get the chat id an update belongs to, or None if it has no chat."""
+    if isinstance(update, Update) and update.effective_chat:
+        return update.effective_chat.id
+    return None
+
+
+class PerChatUpdateProcessor(BaseUpdateProcessor):
+    """Process updates concurrently while serializing updates per chat.
+
+    `max_concurrent_updates` caps how many handlers run at once across all chats.
+    Pass `handler_slots` to share that cap between several processors (one per
+    bot); `max_concurrent_updates` is then ignored.
+    `max_pending_updates` bounds how many updates may be admitted (running or
+    waiting) at the same time.
+
+    The chat lock is taken before a handler slot, so a chat with updates queued
+    behind its own never holds handler slots. Admission slots are taken first
+    (by PTB), so each chat may have at most `max_updates_per_chat` updates
+    admitted; further updates from that chat are dropped. One chat flooding the
+    bot therefore holds at most that many admission slots.
+    """
+
+    __slots__ = ("_handler_slots", "_chat_locks", "_max_updates_per_chat")
+
+    def __init__(self, max_concurrent_updates: int, max_pending_updates: int = None,
+                 max_updates_per_chat: int = 8, handler_slots: asyncio.Semaphore = None):
+        if max_pending_updates is None:
+            max_pending_updates = max_concurrent_updates * 4
+        if max_pending_updates < max_concurrent_updates:
+            raise ValueError("`max_pending_updates` must be >= `max_concurrent_updates`")
+        super().__init__(max_pending_updates)
+        if max_concurrent_updates < 1:
+            raise ValueError("`max_concurrent_updates` must be a positive integer!")
+        if max_updates_per_chat < 1:
+            raise ValueError("`max_updates_per_chat` must be a positive integer!")
+        self._max_updates_per_chat = max_updates_per_chat
+        self._handler_slots = handler_slots or asyncio.Semaphore(max_concurrent_updates)
+        # chat_id -> [lock, number of updates holding or waiting for the lock]
+        self._chat_locks: dict = {}
+
+    @property
+    def active_chats(self) -> int:
+        """Number of chats with an update currently running or waiting."""
+        return len(self._chat_locks)
+
+    async def do_process_update(self, update: object, coroutine: Awaitable[Any]) -> None:
+        """Run the update after its chat's previous updates have finished."""
+        chat_id = get_update_chat_id(update)
+        if chat_id is None:
+            async with self._handler_slots:
+                await coroutine
+            return
+
+        entry = self._chat_locks.get(chat_id)
+        if entry is None:
+            entry = self._chat_locks[chat_id] = [asyncio.Lock(), 0]
+        if entry[1] >= self._max_updates_per_chat:
+            logger.warning(f"Dropping update for chat {chat_id}: "
+                           f"{entry[1]} updates already queued")
+            if inspect.iscoroutine(coroutine):
+                coroutine.close()
+            return
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                async with self._handler_slots:
+                    await coroutine
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._chat_locks[chat_id]
+
+    async def initialize(self) -> None:
+        """Nothing to allocate."""
+
+    async def shutdown(self) -> None:
+        """Forget chat locks."""
+        self._chat_locks.clear()
+
+
+class RateLimiter:
+    """Space out calls to at most `rate` per second across all callers.
+
+    Callers are served in the order they call acquire(), so one limiter can be
+    shared by several broadcasts without any of them bursting past the rate.
+    """
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError("`rate` must be positive")
+        self._interval = 1 / rate
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        """Wait for the next free send slot."""
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
@@ -1,11 +1,16 @@
 # Telegram Bot Configuration v2.0
+import json
 import os
 from pathlib import Path
 
+# Bots hosted by this process. BOTS_CONFIG points to a JSON list of bots;
+# without it a single bot runs from BOT_TOKEN.
+BOTS_CONFIG_PATH = os.environ.get("BOTS_CONFIG")
+
 # Load from environment variable (secure)
 BOT_TOKEN = os.environ.get("BOT_TOKEN")
 
-if not BOT_TOKEN:
+if not BOT_TOKEN and not BOTS_CONFIG_PATH:
     raise ValueError("BOT_TOKEN environment variable is required")
 
 # Bot settings
@@ -16,11 +21,102 @@ WEB_URL = "https://aidenvibe.github.io/once-a-week/"
 DAILY_NOTIFICATION_HOUR = 19
 DAILY_NOTIFICATION_MINUTE = 0
 
-# Data paths
-BOT_DIR = Path(__file__).parent.resolve()
-DEFAULT_QUESTIONS_PATH = BOT_DIR / "data" / "questions.json"
-DEFAULT_SUBSCRIBERS_PATH = BOT_DIR / "data" / "subscribers.json"
+# Update processing - handlers for different chats run concurrently,
+# updates from the same chat are always handled in order.
+# MAX_CONCURRENT_UPDATES is shared by all bots, MAX_PENDING_UPDATES is per bot
+MAX_CONCURRENT_UPDATES = int(os.environ.get("MAX_CONCURRENT_UPDATES", "32"))
+MAX_PENDING_UPDATES = int(os.environ.get("MAX_PENDING_UPDATES", "256"))
+# Updates one chat may have queued; more are dropped so a flood can't fill the queue
+MAX_UPDATES_PER_CHAT = int(os.environ.get("MAX_UPDATES_PER_CHAT", "8"))
+
+# Admin chat ids (comma separated) allowed to use /profile
+ADMIN_CHAT_IDS = {
+    int(chat_id) for chat_id in os.environ.get("ADMIN_CHAT_IDS", "").split(",") if chat_id.strip()
+}
+
+# Profiling - default session length for SIGUSR1 and /profile
+PROFILE_DEFAULT_SECONDS = int(os.environ.get("PROFILE_DEFAULT_SECONDS", "60"))
+
+# Data paths (defined in storage so tools can use them without a BOT_TOKEN)
+from storage import (  # noqa: E402
+    BOT_DIR,
+    DEFAULT_QUESTIONS_PATH,
+    DEFAULT_SUBSCRIBERS_PATH,
+    DEFAULT_ANALYTICS_PATH,
+    DEFAULT_BROADCAST_PATH,
+    QUESTIONS_JSON_PATH,
+    SUBSCRIBERS_JSON_PATH,
+    ANALYTICS_JSON_PATH,
+    BROADCAST_JSON_PATH,
+)
+
+# Copy analytics are counted in memory and written to disk in batches
+ANALYTICS_FLUSH_SECONDS = int(os.environ.get("ANALYTICS_FLUSH_SECONDS", "300"))
+
+# Broadcast rate shared by all bots in this process (messages per second)
+BROADCAST_RATE_PER_SECOND = float(os.environ.get("BROADCAST_RATE_PER_SECOND", "25"))
+
+# Broadcast progress is checkpointed every N sends so an interrupted run can resume
+BROADCAST_CHECKPOINT_EVERY = int(os.environ.get("BROADCAST_CHECKPOINT_EVERY", "20"))
+
+# On SIGTERM, running broadcasts get this long to finish before they are checkpointed
+# (keep below kill_timeout in fly.toml)
+SHUTDOWN_DRAIN_SECONDS = float(os.environ.get("SHUTDOWN_DRAIN_SECONDS", "20"))
+# After the drain, broadcasts get this long to stop before they are cancelled
+SHUTDOWN_STOP_SECONDS = float(os.environ.get("SHUTDOWN_STOP_SECONDS", "3"))
+
+
+def load_tenants() -> list:
+    """Load the bots to host.
+
+    Each entry in BOTS_CONFIG looks like:
+        {"name": "ko", "token_env": "BOT_TOKEN_KO", "web_url": "...",
+         "subscribers_path": "...", "analytics_path": "...", "broadcast_path": "...",
+         "notification_hour": 19, "notification_minute": 0}
+    Only name and token_env are required. Each bot keeps its subscribers,
+    analytics and broadcast checkpoint under data/<name>/ unless paths are given.
+    """
+    if not BOTS_CONFIG_PATH:
+        return [{
+            "name": "default",
+            "token": BOT_TOKEN,
+            "web_url": WEB_URL,
+            "subscribers_path": SUBSCRIBERS_JSON_PATH,
+            "analytics_path": ANALYTICS_JSON_PATH,
+            "broadcast_path": BROADCAST_JSON_PATH,
+            "notification_hour": DAILY_NOTIFICATION_HOUR,
+            "notification_minute": DAILY_NOTIFICATION_MINUTE,
+        }]
+
+    with open(BOTS_CONFIG_PATH, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+
+    tenants = []
+    for entry in entries:
+        name = entry.get("name")
+        if not name or any(t["name"] == name for t in tenants):
+            raise ValueError(f"Bot name missing or duplicated in {BOTS_CONFIG_PATH}: {name!r}")
+        token = os.environ.get(entry.get("token_env", ""))
+        if not token:
+            raise ValueError(f"Token environment variable for bot '{name}' is not set")
+        if any(t["token"] == token for t in tenants):
+            raise ValueError(f"Bot '{name}' uses the same token as another bot")
+
+        tenant_dir = BOT_DIR / "data" / name
+        tenants.append({
+            "name": name,
+            "token": token,
+            "web_url": entry.get("web_url", WEB_URL),
+            "subscribers_path": Path(entry.get("subscribers_path", tenant_dir / "subscribers.json")),
+            "analytics_path": Path(entry.get("analytics_path", tenant_dir / "analytics.json")),
+            "broadcast_path": Path(entry.get("broadcast_path", tenant_dir / "broadcast.json")),
+            "notification_hour": entry.get("notification_hour", DAILY_NOTIFICATION_HOUR),
+            "notification_minute": entry.get("notification_minute", DAILY_NOTIFICATION_MINUTE),
+        })
+
+    if not tenants:
+        raise ValueError(f"No bots configured in {BOTS_CONFIG_PATH}")
+    return tenants
+
 
-# Environment variables override defaults
-QUESTIONS_JSON_PATH = Path(os.environ.get("QUESTIONS_PATH", str(DEFAULT_QUESTIONS_PATH)))
-SUBSCRIBERS_JSON_PATH = Path(os.environ.get("SUBSCRIBERS_PATH", str(DEFAULT_SUBSCRIBERS_PATH)))
+TENANTS = load_tenants()
@@ -6,13 +6,15 @@ Sends daily questions to help users connect with their parents.
 import json
 import os
 import logging
-import tempfile
-import shutil
+import re
 import asyncio
+import signal
 from datetime import datetime
 from pathlib import Path
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import BadRequest, Forbidden
+from telegram.helpers import escape_markdown
 from telegram.ext import (
     Application,
     CommandHandler,
@@ -22,6 +24,10 @@ from telegram.ext import (
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 import config
+from analytics import CopyAnalytics
+from concurrency import PerChatUpdateProcessor, RateLimiter
+from profiling import Profiler
+from storage import save_json_atomic
 
 # Setup logging
 logging.basicConfig(
@@ -33,28 +39,105 @@ logger = logging.getLogger(__name__)
 # Constants
 THEME_LABELS = {"past": "과거", "future": "미래", "holiday": "기념일"}
 START_DATE = datetime(2025, 12, 12)
+MAX_QUESTION_LENGTH = 1000
+HOLIDAY_DATE_PATTERN = re.compile(r"^(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])$")
 
 # Data storage paths
 DATA_DIR = config.BOT_DIR / "data"
 SUBSCRIBERS_PATH = config.SUBSCRIBERS_JSON_PATH
 QUESTIONS_PATH = config.QUESTIONS_JSON_PATH
 
+# Rendered question catalog, reloaded only when the questions file changes
+_questions_cache = {}
 
-def ensure_data_dir():
-    """Ensure data directory exists."""
-    DATA_DIR.mkdir(exist_ok=True)
+# Today's questions and message, shared by all bots until the date or catalog changes
+_payload_cache = {}
+
+# On-demand profiling (SIGUSR1 or /profile), reports go to data/profiles
+profiler = Profiler(DATA_DIR / "profiles")
+
+# One send rate shared by every bot's broadcast
+broadcast_limiter = RateLimiter(config.BROADCAST_RATE_PER_SECOND)
+
+# Set on shutdown once the drain deadline passes; broadcasts checkpoint and return
+stop_broadcasts = asyncio.Event()
+_running_broadcasts = set()
+
+
+def ensure_data_dir(path: Path = None):
+    """Ensure data directory (or the directory holding `path`) exists."""
+    (Path(path).parent if path else DATA_DIR).mkdir(parents=True, exist_ok=True)
+
+
+def md(text: str) -> str:
+    """Escape plain text for MarkdownV2."""
+    return escape_markdown(text, version=2)
+
+
+def render_question(entry, text_key: str = "text") -> dict:
+    """Validate a catalog entry and attach its pre-escaped MarkdownV2 form.
+
+    Returns None for entries that would make Telegram reject the message.
+    """
+    if not isinstance(entry, dict):
+        return None
+    text = entry.get(text_key)
+    if not isinstance(text, str) or not text.strip():
+        return None
+    if len(text) > MAX_QUESTION_LENGTH:
+        return None
+    return {**entry, "markdown": f"_{md(text.strip())}_"}
+
+
+def render_questions(data: dict) -> dict:
+    """Validate and pre-render every question in the raw catalog.
+
+    Invalid entries (missing id/text, duplicate id, bad holiday date) are
+    dropped and logged here so sends never fail on them later.
+    """
+    questions = {"daily": [], "special": [], "holidays": []}
+    raw_questions = data.get("questions", {})
+
+    for kind in ("daily", "special"):
+        seen_ids = set()
+        for entry in raw_questions.get(kind, []):
+            rendered = render_question(entry)
+            question_id = rendered.get("id") if rendered else None
+            if (not isinstance(question_id, int) or isinstance(question_id, bool)
+                    or question_id in seen_ids):
+                logger.error(f"Skipping invalid {kind} question: {entry!r}")
+                continue
+            seen_ids.add(question_id)
+            questions[kind].append(rendered)
+
+    for entry in data.get("holidays", []):
+        rendered = render_question(entry, text_key="question")
+        if not rendered or not HOLIDAY_DATE_PATTERN.match(str(rendered.get("date", ""))):
+            logger.error(f"Skipping invalid holiday: {entry!r}")
+            continue
+        questions["holidays"].append(rendered)
+
+    return questions
 
 
 def load_questions() -> dict:
-    """Load questions from JSON file (new schema with daily/special/holidays)."""
+    """Load questions from JSON file (new schema with daily/special/holidays).
+
+    The catalog is validated and rendered once, then served from cache until
+    the file changes.
+    """
     try:
+        stat = os.stat(QUESTIONS_PATH)
+        cache_key = (str(QUESTIONS_PATH), stat.st_mtime_ns, stat.st_size)
+        if _questions_cache.get("key") == cache_key:
+            return _questions_cache["questions"]
+
         with open(QUESTIONS_PATH, "r", encoding="utf-8") as f:
             data = json.load(f)
-            return {
-                "daily": data.get("questions", {}).get("daily", []),
-                "special": data.get("questions", {}).get("special", []),
-                "holidays": data.get("holidays", [])
-            }
+        questions = render_questions(data)
+        _questions_cache["key"] = cache_key
+        _questions_cache["questions"] = questions
+        return questions
     except FileNotFoundError:
         logger.error(f"Questions file not found: {QUESTIONS_PATH}")
         return {"daily": [], "special": [], "holidays": []}
@@ -63,34 +146,34 @@ def load_questions() -> dict:
         return {"daily": [], "special": [], "holidays": []}
 
 
-def load_subscribers() -> dict:
-    """Load subscribers from JSON file."""
-    ensure_data_dir()
+def load_subscribers(path: Path = None) -> dict:
+    """Load subscribers from JSON file (SUBSCRIBERS_PATH unless a bot's path is given)."""
+    path = path or SUBSCRIBERS_PATH
+    ensure_data_dir(path)
     try:
-        with open(SUBSCRIBERS_PATH, "r", encoding="utf-8") as f:
+        with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
         return {"subscribers": [], "sent_log": []}
 
 
-def save_subscribers(data: dict):
+def save_subscribers(data: dict, path: Path = None):
     """Save subscribers atomically to prevent data corruption."""
-    ensure_data_dir()
+    save_json_atomic(data, path or SUBSCRIBERS_PATH)
+
 
-    temp_fd, temp_path = tempfile.mkstemp(dir=DATA_DIR, suffix=".json")
+def load_broadcast_checkpoint(path: Path) -> dict:
+    """Load a bot's broadcast checkpoint ({} if there is none)."""
     try:
-        with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        shutil.move(temp_path, SUBSCRIBERS_PATH)
-    except Exception:
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
-        raise
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
 
 
-def add_subscriber(chat_id: int, username: str = None) -> bool:
+def add_subscriber(chat_id: int, username: str = None, path: Path = None) -> bool:
     """Add a new subscriber. Returns True if new, False if already exists."""
-    data = load_subscribers()
+    data = load_subscribers(path)
 
     for sub in data["subscribers"]:
         if sub["chat_id"] == chat_id:
@@ -102,18 +185,18 @@ def add_subscriber(chat_id: int, username: str = None) -> bool:
         "subscribed_at": datetime.now().isoformat(),
         "sent_count": 0
     })
-    save_subscribers(data)
+    save_subscribers(data, path)
     return True
 
 
-def remove_subscriber(chat_id: int) -> bool:
+def remove_subscriber(chat_id: int, path: Path = None) -> bool:
     """Remove a subscriber. Returns True if removed, False if not found."""
-    data = load_subscribers()
+    data = load_subscribers(path)
     original_count = len(data["subscribers"])
     data["subscribers"] = [s for s in data["subscribers"] if s["chat_id"] != chat_id]
 
     if len(data["subscribers"]) < original_count:
-        save_subscribers(data)
+        save_subscribers(data, path)
         return True
     return False
 
@@ -145,7 +228,8 @@ def get_special_question(questions: dict, date: datetime) -> dict:
             return {
                 "text": holiday.get("question", ""),
                 "theme": "holiday",
-                "name": holiday.get("name", "")
+                "name": holiday.get("name", ""),
+                "markdown": holiday.get("markdown")
             }
 
     # 2. Regular special question
@@ -158,21 +242,28 @@ def get_special_question(questions: dict, date: datetime) -> dict:
     return special_list[index]
 
 
+def question_markdown(question: dict) -> str:
+    """Get the pre-rendered MarkdownV2 form of a question (rendering it if missing)."""
+    if not question:
+        return md("-")
+    return question.get("markdown") or f"_{md(question['text'])}_"
+
+
 def format_today_message(daily: dict, special: dict) -> str:
-    """Format today's questions for display."""
+    """Format today's questions for display (MarkdownV2)."""
     if not daily and not special:
-        return "질문을 불러올 수 없습니다."
+        return md("질문을 불러올 수 없습니다.")
 
     theme_label = THEME_LABELS.get(special.get("theme", ""), "") if special else ""
 
     lines = [
-        "오늘의 질문이 도착했어요!",
+        md("오늘의 질문이 도착했어요!"),
         "",
         "*일상 질문*",
-        f"_{daily['text']}_" if daily else "-",
+        question_markdown(daily),
         "",
-        f"*특별 질문* ({theme_label})" if theme_label else "*특별 질문*",
-        f"_{special['text']}_" if special else "-",
+        f"*특별 질문* {md(f'({theme_label})')}" if theme_label else "*특별 질문*",
+        question_markdown(special),
         "",
         "_오늘 꼭 보내지 않아도 괜찮아요_"
     ]
@@ -180,53 +271,90 @@ def format_today_message(daily: dict, special: dict) -> str:
     return "\n".join(lines)
 
 
-# Command handlers (only /start and /stop)
+def get_today_payload(date: datetime) -> tuple:
+    """Get (daily, special, message) for a date, cached and shared by all bots."""
+    questions = load_questions()
+    cache_key = (_questions_cache.get("key"), date.strftime("%Y-%m-%d"))
+    if _payload_cache.get("key") != cache_key:
+        daily = get_daily_question(questions, date)
+        special = get_special_question(questions, date)
+        _payload_cache["key"] = cache_key
+        _payload_cache["payload"] = (daily, special, format_today_message(daily, special))
+    return _payload_cache["payload"]
+
+
+def build_question_keyboard(daily: dict, special: dict, web_url: str) -> InlineKeyboardMarkup:
+    """Build the copy / web buttons shown under today's questions."""
+    keyboard = [
+        [
+            InlineKeyboardButton("일상 복사", callback_data=f"copy_daily_{daily['id']}" if daily else "none"),
+            InlineKeyboardButton("특별 복사", callback_data=f"copy_special_{special['id']}" if special else "none")
+        ],
+        [InlineKeyboardButton("웹에서 보기", url=web_url)]
+    ]
+    return InlineKeyboardMarkup(keyboard)
+
+
+def get_tenant(context: ContextTypes.DEFAULT_TYPE) -> dict:
+    """Get the config of the bot handling this update."""
+    return context.bot_data["tenant"]
+
+
+def format_notification_time(hour: int, minute: int) -> str:
+    """Korean time of day for the welcome text, e.g. 19:00 -> '저녁 7시'."""
+    if hour < 6:
+        period = "새벽"
+    elif hour < 12:
+        period = "아침"
+    elif hour < 18:
+        period = "낮"
+    else:
+        period = "저녁"
+    text = f"{period} {hour % 12 or 12}시"
+    if minute:
+        text += f" {minute}분"
+    return text
+
+
+# Command handlers
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /start command."""
     user = update.effective_user
     chat_id = update.effective_chat.id
 
-    is_new = add_subscriber(chat_id, user.username)
+    tenant = get_tenant(context)
+    is_new = add_subscriber(chat_id, user.username, tenant["subscribers_path"])
 
     if is_new:
+        notification_time = format_notification_time(
+            tenant["notification_hour"], tenant["notification_minute"]
+        )
         welcome_text = (
-            f"안녕하세요, {user.first_name}님!\n\n"
-            "*주에한번은*에 오신 것을 환영해요.\n\n"
-            "매일 저녁 7시, 부모님께 보낼 수 있는\n"
-            "따뜻한 질문을 보내드릴게요.\n\n"
-            "구독을 취소하려면 /stop 을 입력하세요.\n\n"
+            md(f"안녕하세요, {user.first_name}님!") + "\n\n"
+            "*주에한번은*" + md("에 오신 것을 환영해요.") + "\n\n"
+            + md(f"매일 {notification_time}, 부모님께 보낼 수 있는\n"
+                 "따뜻한 질문을 보내드릴게요.\n\n"
+                 "구독을 취소하려면 /stop 을 입력하세요.") + "\n\n"
             "_효도는 빈도입니다_"
         )
     else:
-        welcome_text = (
+        welcome_text = md(
             f"다시 오셨네요, {user.first_name}님!\n\n"
             "이미 구독 중이시네요.\n\n"
             "구독을 취소하려면 /stop 을 입력하세요."
         )
 
     # Show today's questions
-    questions = load_questions()
-    today = datetime.now()
-    daily = get_daily_question(questions, today)
-    special = get_special_question(questions, today)
-
-    keyboard = [
-        [
-            InlineKeyboardButton("일상 복사", callback_data=f"copy_daily_{daily['id']}" if daily else "none"),
-            InlineKeyboardButton("특별 복사", callback_data=f"copy_special_{special['id']}" if special else "none")
-        ],
-        [InlineKeyboardButton("웹에서 보기", url=config.WEB_URL)]
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    daily, special, question_message = get_today_payload(datetime.now())
+    reply_markup = build_question_keyboard(daily, special, tenant["web_url"])
 
     # Send welcome first
-    await update.message.reply_text(welcome_text, parse_mode="Markdown")
+    await update.message.reply_text(welcome_text, parse_mode="MarkdownV2")
 
     # Then send today's questions
-    question_message = format_today_message(daily, special)
     await update.message.reply_text(
         question_message,
-        parse_mode="Markdown",
+        parse_mode="MarkdownV2",
         reply_markup=reply_markup
     )
 
@@ -234,7 +362,7 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def stop_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /stop command - unsubscribe."""
     chat_id = update.effective_chat.id
-    removed = remove_subscriber(chat_id)
+    removed = remove_subscriber(chat_id, get_tenant(context)["subscribers_path"])
 
     if removed:
         await update.message.reply_text(
@@ -248,6 +376,36 @@ async def stop_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
 
 
+async def profile_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /profile command (admin only).
+
+    /profile [seconds]  - profile for N seconds (default PROFILE_DEFAULT_SECONDS)
+    /profile broadcast  - profile the next daily broadcast
+    /profile stop       - stop the running session and write the report
+    """
+    if update.effective_chat.id not in config.ADMIN_CHAT_IDS:
+        return
+
+    arg = context.args[0].lower() if context.args else ""
+
+    if arg == "stop":
+        report = profiler.stop()
+        text = f"Profile written: {report}" if report else "No profiling session running."
+    elif arg == "broadcast":
+        profiler.arm_next_broadcast()
+        text = "Next broadcast will be profiled."
+    elif arg and (not arg.isdecimal() or int(arg) < 1):
+        text = "Usage: /profile [seconds >= 1 | broadcast | stop]"
+    else:
+        seconds = int(arg) if arg else config.PROFILE_DEFAULT_SECONDS
+        if profiler.start(seconds):
+            text = f"Profiling for {seconds}s."
+        else:
+            text = "Profiling already running. Use /profile stop."
+
+    await update.message.reply_text(text, parse_mode=None)
+
+
 # Callback query handlers
 async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle button callbacks."""
@@ -268,6 +426,7 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         question = next((q for q in daily_list if q["id"] == question_id), None)
 
         if question:
+            context.bot_data["analytics"].record(question_id, "daily")
             await query.message.reply_text(question["text"], parse_mode=None)
             await query.answer("일상 질문이 전송되었어요! 복사하세요.", show_alert=False)
         else:
@@ -279,6 +438,7 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         question = next((q for q in special_list if q["id"] == question_id), None)
 
         if question:
+            context.bot_data["analytics"].record(question_id, "special")
             await query.message.reply_text(question["text"], parse_mode=None)
             await query.answer("특별 질문이 전송되었어요! 복사하세요.", show_alert=False)
         else:
@@ -286,95 +446,251 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 # Scheduled notification
-async def send_with_retry(bot, chat_id: int, message: str, reply_markup, max_retries: int = 3) -> bool:
-    """Send message with exponential backoff retry logic."""
+async def send_with_retry(bot, chat_id: int, message: str, reply_markup, max_retries: int = 3):
+    """Send message with exponential backoff retry logic.
+
+    Returns True if sent, False if it failed, or None if shutdown stopped the
+    retries before the message went out.
+    """
     for attempt in range(max_retries):
+        if stop_broadcasts.is_set():
+            return None
         try:
+            await broadcast_limiter.acquire()
             await bot.send_message(
                 chat_id=chat_id,
                 text=message,
-                parse_mode="Markdown",
+                parse_mode="MarkdownV2",
                 reply_markup=reply_markup
             )
             return True
+        except (BadRequest, Forbidden) as e:
+            # Malformed message or blocked bot - retrying cannot succeed
+            logger.error(f"Not retrying {chat_id}: {e}")
+            return False
         except Exception as e:
             if attempt < max_retries - 1:
                 wait_time = 2 ** attempt
                 logger.warning(f"Retry {attempt + 1}/{max_retries} for {chat_id}: {e}")
-                await asyncio.sleep(wait_time)
+                # Back off, but wake up at once if shutdown asks broadcasts to stop
+                try:
+                    await asyncio.wait_for(stop_broadcasts.wait(), timeout=wait_time)
+                except asyncio.TimeoutError:
+                    pass
             else:
                 logger.error(f"Failed to send to {chat_id} after {max_retries} attempts: {e}")
                 return False
 
 
-async def send_daily_notification(context: ContextTypes.DEFAULT_TYPE):
-    """Send daily question notification to all subscribers."""
-    questions = load_questions()
+async def send_daily_notification(application: Application):
+    """Send daily question notification to all subscribers of one bot.
+
+    Progress is checkpointed to the bot's broadcast file. If today's broadcast
+    was interrupted, calling this again continues with the remaining chats.
+    """
+    tenant = application.bot_data["tenant"]
+    checkpoint_path = tenant["broadcast_path"]
     today = datetime.now()
-    daily = get_daily_question(questions, today)
-    special = get_special_question(questions, today)
+    daily, special, message = get_today_payload(today)
+    reply_markup = build_question_keyboard(daily, special, tenant["web_url"])
 
-    message = format_today_message(daily, special)
+    subscriber_ids = [sub["chat_id"] for sub in load_subscribers(tenant["subscribers_path"])["subscribers"]]
+    state = load_broadcast_checkpoint(checkpoint_path)
 
-    keyboard = [
-        [
-            InlineKeyboardButton("일상 복사", callback_data=f"copy_daily_{daily['id']}" if daily else "none"),
-            InlineKeyboardButton("특별 복사", callback_data=f"copy_special_{special['id']}" if special else "none")
-        ],
-        [InlineKeyboardButton("웹에서 보기", url=config.WEB_URL)]
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    if state.get("date") != today.strftime("%Y-%m-%d"):
+        state = {"date": today.strftime("%Y-%m-%d"), "pending": subscriber_ids, "sent": 0, "failed": 0}
+    elif state.get("status") == "done":
+        logger.info(f"[{tenant['name']}] Daily notification already sent today")
+        return
+    else:
+        # Resume; skip chats that unsubscribed in the meantime
+        current = set(subscriber_ids)
+        state["pending"] = [chat_id for chat_id in state.get("pending", []) if chat_id in current]
+        logger.info(f"[{tenant['name']}] Resuming daily notification, {len(state['pending'])} left")
 
-    subscribers_data = load_subscribers()
-    sent_count = 0
-    failed_count = 0
+    state["status"] = "running"
+    save_json_atomic(state, checkpoint_path)
 
-    for sub in subscribers_data["subscribers"]:
-        success = await send_with_retry(
-            context.bot, sub["chat_id"], message, reply_markup
-        )
-        if success:
-            sent_count += 1
-        else:
-            failed_count += 1
+    _running_broadcasts.add(asyncio.current_task())
+    pending = state["pending"]
+    done = 0
+    try:
+        async with profiler.broadcast():
+            for chat_id in pending:
+                if stop_broadcasts.is_set():
+                    break
+                success = await send_with_retry(application.bot, chat_id, message, reply_markup)
+                if success is None:
+                    # Stopped while retrying; this chat stays pending
+                    break
+                state["sent" if success else "failed"] += 1
+                done += 1
+                if done % config.BROADCAST_CHECKPOINT_EVERY == 0:
+                    state["pending"] = pending[done:]
+                    save_json_atomic(state, checkpoint_path)
+    finally:
+        _running_broadcasts.discard(asyncio.current_task())
+        state["pending"] = pending[done:]
+        state["status"] = "interrupted" if state["pending"] else "done"
+        save_json_atomic(state, checkpoint_path)
+
+    if state["status"] == "done":
+        logger.info(f"[{tenant['name']}] Daily notification: "
+                    f"{state['sent']} sent, {state['failed']} failed")
+    else:
+        logger.warning(f"[{tenant['name']}] Daily notification interrupted, "
+                       f"{len(state['pending'])} left for next start")
 
-    logger.info(f"Daily notification: {sent_count} sent, {failed_count} failed")
 
+def has_interrupted_broadcast(tenant: dict) -> bool:
+    """Check whether today's broadcast for a bot stopped before finishing."""
+    state = load_broadcast_checkpoint(tenant["broadcast_path"])
+    return (state.get("date") == datetime.now().strftime("%Y-%m-%d")
+            and state.get("status") != "done"
+            and bool(state.get("pending")))
 
-async def post_init(application: Application):
-    """Post initialization hook to start scheduler."""
-    scheduler = AsyncIOScheduler()
-    scheduler.add_job(
-        send_daily_notification,
-        "cron",
-        hour=config.DAILY_NOTIFICATION_HOUR,
-        minute=config.DAILY_NOTIFICATION_MINUTE,
-        args=[application]
-    )
-    scheduler.start()
-    logger.info(f"Daily notifications scheduled for: "
-                f"{config.DAILY_NOTIFICATION_HOUR:02d}:{config.DAILY_NOTIFICATION_MINUTE:02d}")
 
+async def drain_broadcasts(deadline: float, stop_timeout: float = 3.0):
+    """Let running broadcasts finish for up to `deadline` seconds, then checkpoint them.
 
-def main():
-    """Start the bot."""
+    Broadcasts still running are asked to stop and get `stop_timeout` seconds to
+    do so; any left after that are cancelled.
+    """
+    if not _running_broadcasts:
+        return
+    logger.info(f"Waiting up to {deadline:g}s for {len(_running_broadcasts)} broadcast(s)")
+    await asyncio.wait(set(_running_broadcasts), timeout=deadline)
+
+    if not _running_broadcasts:
+        return
+    stop_broadcasts.set()
+    # Each broadcast stops after its current send and saves its checkpoint
+    stopping = set(_running_broadcasts)
+    await asyncio.wait(stopping, timeout=stop_timeout)
+
+    stuck = [task for task in stopping if not task.done()]
+    if stuck:
+        logger.warning(f"Cancelling {len(stuck)} broadcast(s) that did not stop in time")
+        for task in stuck:
+            task.cancel()
+        # Cancelled broadcasts still save their checkpoint; the message being
+        # sent when cancelled stays pending and may be sent again on resume
+        await asyncio.wait(stuck)
+
+
+async def flush_analytics(application: Application):
+    """Write out one bot's pending copy analytics (runs in the event loop)."""
+    application.bot_data["analytics"].flush()
+
+
+def build_application(tenant: dict, handler_slots: asyncio.Semaphore = None) -> Application:
+    """Build the Application for one bot. Catalog, payload cache and send rate are shared.
+
+    Pass the same `handler_slots` to every bot so MAX_CONCURRENT_UPDATES caps
+    handlers across the whole process rather than per bot.
+    """
     application = (
         Application.builder()
-        .token(config.BOT_TOKEN)
-        .post_init(post_init)
+        .token(tenant["token"])
+        .concurrent_updates(PerChatUpdateProcessor(
+            config.MAX_CONCURRENT_UPDATES, config.MAX_PENDING_UPDATES,
+            config.MAX_UPDATES_PER_CHAT, handler_slots
+        ))
         .build()
     )
+    application.bot_data["tenant"] = tenant
+    application.bot_data["analytics"] = CopyAnalytics(tenant["analytics_path"])
 
-    # Add command handlers (only /start and /stop)
+    # Add command handlers (/start, /stop and admin-only /profile)
     application.add_handler(CommandHandler("start", start_command))
     application.add_handler(CommandHandler("stop", stop_command))
+    application.add_handler(CommandHandler("profile", profile_command))
 
     # Add callback query handler
     application.add_handler(CallbackQueryHandler(button_callback))
 
-    logger.info("Bot v2.0 started!")
+    return application
+
+
+def schedule_jobs(scheduler: AsyncIOScheduler, application: Application):
+    """Add one bot's daily broadcast and analytics flush to the shared scheduler."""
+    tenant = application.bot_data["tenant"]
+    scheduler.add_job(
+        send_daily_notification,
+        "cron",
+        hour=tenant["notification_hour"],
+        minute=tenant["notification_minute"],
+        args=[application]
+    )
+    scheduler.add_job(
+        flush_analytics,
+        "interval",
+        seconds=config.ANALYTICS_FLUSH_SECONDS,
+        args=[application]
+    )
+    logger.info(f"[{tenant['name']}] Daily notifications scheduled for: "
+                f"{tenant['notification_hour']:02d}:{tenant['notification_minute']:02d}")
+
+
+async def run_bots(applications: list):
+    """Run every bot in this event loop until SIGINT/SIGTERM, then shut down gracefully.
 
-    application.run_polling(allowed_updates=Update.ALL_TYPES)
+    Shutdown order: stop the scheduler from starting jobs, stop polling for
+    updates, let broadcasts drain until SHUTDOWN_DRAIN_SECONDS (then checkpoint
+    them), finish in-flight handlers, flush analytics and stop the scheduler.
+    """
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    # SIGUSR1 toggles a profiling session (not available on Windows)
+    if hasattr(signal, "SIGUSR1"):
+        loop.add_signal_handler(signal.SIGUSR1, profiler.toggle, config.PROFILE_DEFAULT_SECONDS)
+
+    scheduler = AsyncIOScheduler()
+    started = []
+    try:
+        for application in applications:
+            await application.initialize()
+            started.append(application)
+            await application.updater.start_polling(allowed_updates=Update.ALL_TYPES)
+            await application.start()
+            schedule_jobs(scheduler, application)
+        scheduler.start()
+
+        # Continue broadcasts cut off by the previous shutdown
+        for application in applications:
+            if has_interrupted_broadcast(application.bot_data["tenant"]):
+                scheduler.add_job(send_daily_notification, args=[application])
+
+        logger.info(f"Bot v2.0 started! ({len(applications)} bot(s))")
+        await stop_event.wait()
+    finally:
+        logger.info("Shutting down")
+        if scheduler.running:
+            scheduler.pause()
+        for application in started:
+            if application.updater.running:
+                await application.updater.stop()
+
+        await drain_broadcasts(config.SHUTDOWN_DRAIN_SECONDS, config.SHUTDOWN_STOP_SECONDS)
+
+        for application in started:
+            if application.running:
+                await application.stop()
+            await application.shutdown()
+            application.bot_data["analytics"].flush()
+        if scheduler.running:
+            scheduler.shutdown(wait=False)
+        logger.info("Shutdown complete")
+
+
+def main():
+    """Start every configured bot in one process."""
+    handler_slots = asyncio.Semaphore(config.MAX_CONCURRENT_UPDATES)
+    applications = [build_application(tenant, handler_slots) for tenant in config.TENANTS]
+    asyncio.run(run_bots(applications))
 
 
 if __name__ == "__main__":
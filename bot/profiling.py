@@ -0,0 +1,185 @@
+"""
+On-demand profiling for the running bot.
+Collects cProfile stats, tracemalloc diffs, asyncio task dumps and event-loop lag
+for a time window or for the next broadcast. Nothing runs while no session is active.
+"""
+
+import asyncio
+import cProfile
+import io
+import logging
+import pstats
+import tracemalloc
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+TOP_STATS = 40
+LAG_INTERVAL = 0.05
+
+
+class Profiler:
+    """Profiling session controller. Reports are written under output_dir."""
+
+    def __init__(self, output_dir: Path, lag_interval: float = LAG_INTERVAL):
+        self.output_dir = Path(output_dir)
+        self.lag_interval = lag_interval
+        self._armed_for_broadcast = False
+        self._profile = None
+        self._label = None
+        self._started_at = None
+        self._started_tracemalloc = False
+        self._snapshot = None
+        self._lag_task = None
+        self._lags = []
+        self._stop_handle = None
+
+    @property
+    def active(self) -> bool:
+        return self._profile is not None
+
+    @property
+    def armed_for_broadcast(self) -> bool:
+        return self._armed_for_broadcast
+
+    def start(self, seconds: float = None, label: str = "manual") -> bool:
+        """Start a session, optionally stopping after `seconds`. Returns False if already running.
+
+        Must be called from the running event loop.
+        """
+        if self.active:
+            return False
+
+        loop = asyncio.get_running_loop()
+        self._label = label
+        self._started_at = datetime.now()
+        self._lags = []
+
+        self._started_tracemalloc = not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start()
+        self._snapshot = tracemalloc.take_snapshot()
+
+        self._lag_task = loop.create_task(self._measure_loop_lag(), name="profiler-loop-lag")
+        if seconds:
+            self._stop_handle = loop.call_later(seconds, self.stop)
+
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        logger.info(f"Profiling started ({label}"
+                    + (f", {seconds:g}s)" if seconds else ")"))
+        return True
+
+    def stop(self) -> Path:
+        """Stop the running session and write its report. Returns the report path or None."""
+        if not self.active:
+            return None
+
+        self._profile.disable()
+        profile, self._profile = self._profile, None
+        elapsed = (datetime.now() - self._started_at).total_seconds()
+
+        if self._stop_handle:
+            self._stop_handle.cancel()
+            self._stop_handle = None
+        if self._lag_task:
+            self._lag_task.cancel()
+            self._lag_task = None
+
+        snapshot = tracemalloc.take_snapshot()
+        memory_diff = snapshot.compare_to(self._snapshot, "lineno")
+        current, peak = tracemalloc.get_traced_memory()
+        self._snapshot = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{self._started_at:%Y%m%d-%H%M%S}-{self._label}"
+        profile.dump_stats(self.output_dir / f"{stem}.prof")
+
+        report_path = self.output_dir / f"{stem}.txt"
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write(f"Profile '{self._label}' started {self._started_at.isoformat()}, "
+                    f"{elapsed:.2f}s\n\n")
+            f.write(self._format_cpu(profile))
+            f.write(self._format_memory(memory_diff, current, peak))
+            f.write(self._format_loop_lag())
+            f.write(self._format_tasks())
+
+        logger.info(f"Profiling stopped, report written to {report_path}")
+        return report_path
+
+    def toggle(self, seconds: float = None) -> None:
+        """Start a session if none is running, otherwise stop the current one."""
+        if self.active:
+            self.stop()
+        else:
+            self.start(seconds, label="signal")
+
+    def arm_next_broadcast(self) -> None:
+        """Profile the next broadcast from start to end."""
+        self._armed_for_broadcast = True
+        logger.info("Profiling armed for next broadcast")
+
+    @asynccontextmanager
+    async def broadcast(self):
+        """Wrap a broadcast; profiles it if armed, otherwise does nothing."""
+        if not self._armed_for_broadcast or self.active:
+            yield
+            return
+
+        self._armed_for_broadcast = False
+        self.start(label="broadcast")
+        try:
+            yield
+        finally:
+            self.stop()
+
+    async def _measure_loop_lag(self):
+        """Record how late the loop wakes us up compared to the requested interval."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.lag_interval
+            await asyncio.sleep(self.lag_interval)
+            self._lags.append(max(0.0, loop.time() - expected))
+
+    @staticmethod
+    def _format_cpu(profile: cProfile.Profile) -> str:
+        out = io.StringIO()
+        stats = pstats.Stats(profile, stream=out)
+        stats.sort_stats("cumulative").print_stats(TOP_STATS)
+        return "== CPU (cumulative) ==\n" + out.getvalue() + "\n"
+
+    @staticmethod
+    def _format_memory(diff: list, current: int, peak: int) -> str:
+        lines = [
+            "== Memory (tracemalloc diff) ==",
+            f"traced now: {current / 1024:.1f} KiB, peak: {peak / 1024:.1f} KiB",
+        ]
+        lines += [str(stat) for stat in diff[:TOP_STATS]]
+        return "\n".join(lines) + "\n\n"
+
+    def _format_loop_lag(self) -> str:
+        lags = sorted(self._lags)
+        if not lags:
+            return "== Event loop lag ==\nno samples\n\n"
+        p99 = lags[max(0, int(len(lags) * 0.99) - 1)]
+        return (
+            "== Event loop lag ==\n"
+            f"samples: {len(lags)} every {self.lag_interval * 1000:.0f}ms\n"
+            f"mean: {sum(lags) / len(lags) * 1000:.2f}ms  "
+            f"p99: {p99 * 1000:.2f}ms  max: {lags[-1] * 1000:.2f}ms\n\n"
+        )
+
+    @staticmethod
+    def _format_tasks() -> str:
+        tasks = asyncio.all_tasks()
+        lines = [f"== Asyncio tasks ({len(tasks)}) =="]
+        for task in sorted(tasks, key=lambda t: t.get_name()):
+            lines.append(f"- {task.get_name()}: {task.get_coro()!r}")
+            for frame in task.get_stack(limit=5):
+                lines.append(f"    {frame.f_code.co_filename}:{frame.f_lineno} "
+                             f"in {frame.f_code.co_name}")
+        return "\n".join(lines) + "\n"
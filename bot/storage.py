@@ -0,0 +1,40 @@
+"""
+Data file locations and atomic JSON writes.
+Kept free of bot settings so command line tools can use it without a BOT_TOKEN.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+# Data paths
+BOT_DIR = Path(__file__).parent.resolve()
+DATA_DIR = BOT_DIR / "data"
+DEFAULT_QUESTIONS_PATH = DATA_DIR / "questions.json"
+DEFAULT_SUBSCRIBERS_PATH = DATA_DIR / "subscribers.json"
+DEFAULT_ANALYTICS_PATH = DATA_DIR / "analytics.json"
+DEFAULT_BROADCAST_PATH = DATA_DIR / "broadcast.json"
+
+# Environment variables override defaults
+QUESTIONS_JSON_PATH = Path(os.environ.get("QUESTIONS_PATH", str(DEFAULT_QUESTIONS_PATH)))
+SUBSCRIBERS_JSON_PATH = Path(os.environ.get("SUBSCRIBERS_PATH", str(DEFAULT_SUBSCRIBERS_PATH)))
+ANALYTICS_JSON_PATH = Path(os.environ.get("ANALYTICS_PATH", str(DEFAULT_ANALYTICS_PATH)))
+BROADCAST_JSON_PATH = Path(os.environ.get("BROADCAST_PATH", str(DEFAULT_BROADCAST_PATH)))
+
+
+def save_json_atomic(data: dict, path: Path):
+    """Write JSON atomically to prevent data corruption."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    temp_fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".json")
+    try:
+        with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        shutil.move(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
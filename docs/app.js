@@ -5,9 +5,15 @@
 // ========================================
 // Constants
 // ========================================
-const START_DATE = new Date('2025-12-12');
+const START_DATE_STR = '2025-12-12';
+const START_DATE = new Date(START_DATE_STR);
 START_DATE.setHours(0, 0, 0, 0);
 
+// History is rendered a week at a time; at most HISTORY_MAX_DAYS stay in the DOM
+const HISTORY_PAGE_DAYS = 7;
+const HISTORY_MAX_DAYS = 42;
+const HISTORY_PRELOAD_PX = 600;
+
 const DAYS_KO = ['일', '월', '화', '수', '목', '금', '토'];
 const THEME_LABELS = { past: '과거', future: '미래', holiday: '기념일' };
 
@@ -29,6 +35,24 @@ const CHARACTER_MESSAGES = [
 let dailyQuestions = [];
 let specialQuestions = [];
 let holidays = [];
+let dailyById = new Map();
+let specialById = new Map();
+let holidayByDate = new Map();
+
+// Precomputed schedule (docs/data/schedule), chunks fetched on demand
+let schedule = null;
+const scheduleChunks = new Map();
+
+// Rendered history window: days ago [newest, oldest] are in the DOM,
+// hiddenHeights holds the heights of newer days trimmed off the top
+const historyView = {
+  totalDays: 0,
+  newest: 1,
+  oldest: 0,
+  hiddenHeights: [],
+  busy: false,
+  observer: null
+};
 
 // ========================================
 // DOM Elements
@@ -75,12 +99,15 @@ function getDailyQuestion(date) {
   return dailyQuestions[index];
 }
 
+function toHolidayQuestion(holiday) {
+  return { text: holiday.question, theme: 'holiday', name: holiday.name };
+}
+
 function getSpecialQuestion(date) {
   // 1. Holiday check
-  const mmdd = formatMMDD(date);
-  const holiday = holidays.find(h => h.date === mmdd);
+  const holiday = holidayByDate.get(formatMMDD(date));
   if (holiday) {
-    return { text: holiday.question, theme: 'holiday', name: holiday.name };
+    return toHolidayQuestion(holiday);
   }
 
   // 2. Regular special question
@@ -100,6 +127,9 @@ async function loadQuestions() {
     dailyQuestions = data.questions.daily || [];
     specialQuestions = data.questions.special || [];
     holidays = data.holidays || [];
+    dailyById = new Map(dailyQuestions.map(q => [q.id, q]));
+    specialById = new Map(specialQuestions.map(q => [q.id, q]));
+    holidayByDate = new Map(holidays.map(h => [h.date, h]));
     return true;
   } catch (error) {
     console.error('Failed to load questions:', error);
@@ -107,6 +137,49 @@ async function loadQuestions() {
   }
 }
 
+async function loadScheduleIndex() {
+  try {
+    const response = await fetch('./data/schedule/index.json');
+    if (!response.ok) return false;
+    const index = await response.json();
+    if (index.startDate !== START_DATE_STR) return false;
+    schedule = index;
+    return true;
+  } catch (error) {
+    console.error('Failed to load schedule:', error);
+    return false;
+  }
+}
+
+function loadScheduleChunk(chunkIndex) {
+  if (!scheduleChunks.has(chunkIndex)) {
+    const name = `chunk-${String(chunkIndex).padStart(4, '0')}.json`;
+    const request = fetch(`./data/schedule/${name}`)
+      .then(response => (response.ok ? response.json() : null))
+      .catch(() => null);
+    scheduleChunks.set(chunkIndex, request);
+  }
+  return scheduleChunks.get(chunkIndex);
+}
+
+// Questions sent on a date: from the schedule when available,
+// otherwise from the rotation
+async function getQuestionsForDate(date) {
+  const days = getDaysSinceStart(date);
+  if (schedule && days >= 0 && days < schedule.days) {
+    const chunk = await loadScheduleChunk(Math.floor(days / schedule.chunkDays));
+    const entry = chunk && chunk[days % schedule.chunkDays];
+    if (entry) {
+      const holiday = entry.holiday && holidayByDate.get(entry.holiday);
+      return {
+        daily: dailyById.get(entry.daily) || null,
+        special: holiday ? toHolidayQuestion(holiday) : (specialById.get(entry.special) || null)
+      };
+    }
+  }
+  return { daily: getDailyQuestion(date), special: getSpecialQuestion(date) };
+}
+
 // ========================================
 // Rendering
 // ========================================
@@ -135,31 +208,155 @@ function displayTodayQuestions() {
   }
 }
 
-function displayPastQuestions() {
+async function displayPastQuestions(scheduleLoaded) {
+  await scheduleLoaded;
+
   const pastList = $('#pastList');
   pastList.innerHTML = '';
 
+  const spacer = document.createElement('li');
+  spacer.className = 'history-spacer';
+  spacer.id = 'historySpacer';
+  const sentinel = document.createElement('li');
+  sentinel.className = 'history-sentinel';
+  sentinel.id = 'historySentinel';
+  pastList.append(spacer, sentinel);
+
+  historyView.totalDays = Math.max(getDaysSinceStart(new Date()), HISTORY_PAGE_DAYS);
+  historyView.newest = 1;
+  historyView.oldest = 0;
+  historyView.hiddenHeights = [];
+  $('#historySubtitle').textContent = `총 ${historyView.totalDays}일`;
+
+  // Last week right away, older days as the sentinel scrolls into view
+  await appendOlderDays();
+
+  if ('IntersectionObserver' in window) {
+    historyView.observer = new IntersectionObserver(fillHistory, {
+      rootMargin: `${HISTORY_PRELOAD_PX}px 0px`
+    });
+    historyView.observer.observe(spacer);
+    historyView.observer.observe(sentinel);
+  }
+}
+
+async function buildHistoryDays(fromDaysAgo, toDaysAgo) {
   const today = new Date();
+  const step = fromDaysAgo <= toDaysAgo ? 1 : -1;
+  const daysAgoList = [];
+  for (let i = fromDaysAgo; i !== toDaysAgo + step; i += step) {
+    daysAgoList.push(i);
+  }
 
-  for (let i = 1; i <= 7; i++) {
+  const days = await Promise.all(daysAgoList.map(daysAgo => {
     const pastDate = new Date(today);
-    pastDate.setDate(today.getDate() - i);
+    pastDate.setDate(today.getDate() - daysAgo);
+    return getQuestionsForDate(pastDate).then(questions => ({ daysAgo, pastDate, ...questions }));
+  }));
 
-    const daily = getDailyQuestion(pastDate);
-    const special = getSpecialQuestion(pastDate);
+  const fragment = document.createDocumentFragment();
+  for (const { daysAgo, pastDate, daily, special } of days) {
     const dateStr = formatShortDate(pastDate);
 
     // Daily question item
     if (daily) {
-      pastList.appendChild(createHistoryItem(dateStr, 'daily', '일상', daily.text));
+      const item = createHistoryItem(dateStr, 'daily', '일상', daily.text);
+      item.dataset.daysAgo = daysAgo;
+      fragment.appendChild(item);
     }
 
     // Special question item
     if (special) {
       const themeKey = special.theme || 'past';
       const themeLabel = THEME_LABELS[themeKey] || themeKey;
-      pastList.appendChild(createHistoryItem(dateStr, themeKey, themeLabel, special.text));
+      const item = createHistoryItem(dateStr, themeKey, themeLabel, special.text);
+      item.dataset.daysAgo = daysAgo;
+      fragment.appendChild(item);
+    }
+  }
+  return fragment;
+}
+
+function getDayItems(daysAgo) {
+  return $('#pastList').querySelectorAll(`[data-days-ago="${daysAgo}"]`);
+}
+
+// Height a day takes in the list, including the gap to the next element
+function measureDay(items) {
+  if (items.length === 0) return 0;
+  const next = items[items.length - 1].nextElementSibling;
+  return next.offsetTop - items[0].offsetTop;
+}
+
+function setSpacerHeight() {
+  const height = historyView.hiddenHeights.reduce((sum, h) => sum + h, 0);
+  $('#historySpacer').style.height = `${height}px`;
+}
+
+function isNearViewport(element) {
+  const rect = element.getBoundingClientRect();
+  return rect.top < window.innerHeight + HISTORY_PRELOAD_PX && rect.bottom > -HISTORY_PRELOAD_PX;
+}
+
+async function appendOlderDays() {
+  if (historyView.oldest >= historyView.totalDays) return;
+
+  const from = historyView.oldest + 1;
+  const to = Math.min(historyView.oldest + HISTORY_PAGE_DAYS, historyView.totalDays);
+  const fragment = await buildHistoryDays(from, to);
+  $('#pastList').insertBefore(fragment, $('#historySentinel'));
+  historyView.oldest = to;
+
+  // Trim the newest days off the top, keeping their height in the spacer
+  while (historyView.oldest - historyView.newest + 1 > HISTORY_MAX_DAYS) {
+    const items = getDayItems(historyView.newest);
+    historyView.hiddenHeights.push(measureDay(items));
+    items.forEach(item => item.remove());
+    historyView.newest += 1;
+  }
+  setSpacerHeight();
+
+  $('#historySentinel').hidden = historyView.oldest >= historyView.totalDays;
+}
+
+async function restoreNewerDays() {
+  if (historyView.newest <= 1) return;
+
+  const to = historyView.newest - 1;
+  const from = Math.max(1, historyView.newest - HISTORY_PAGE_DAYS);
+  const fragment = await buildHistoryDays(from, to);
+  $('#historySpacer').after(fragment);
+  historyView.hiddenHeights.splice(historyView.hiddenHeights.length - (to - from + 1));
+  historyView.newest = from;
+  setSpacerHeight();
+
+  // Trim the oldest days off the bottom; they are re-rendered on scroll
+  while (historyView.oldest - historyView.newest + 1 > HISTORY_MAX_DAYS) {
+    getDayItems(historyView.oldest).forEach(item => item.remove());
+    historyView.oldest -= 1;
+  }
+
+  $('#historySentinel').hidden = historyView.oldest >= historyView.totalDays;
+}
+
+// Load or restore days while either edge of the window is near the viewport
+// (the observer only fires when visibility changes, so keep going until stable)
+async function fillHistory() {
+  if (historyView.busy) return;
+  historyView.busy = true;
+  try {
+    // Bounded so a viewport taller than the whole window cannot loop forever
+    for (let step = 0; step < HISTORY_MAX_DAYS; step++) {
+      if (!$('#historySentinel').hidden && isNearViewport($('#historySentinel'))) {
+        await appendOlderDays();
+      } else if (historyView.newest > 1 && isNearViewport($('#historySpacer'))) {
+        await restoreNewerDays();
+      } else {
+        break;
+      }
     }
+  } finally {
+    historyView.busy = false;
   }
 }
 
@@ -359,7 +556,8 @@ function trackEvent(eventName, params = {}) {
 // Initialization
 // ========================================
 async function init() {
-  // Load questions
+  // Load questions (schedule index in parallel, only needed for history)
+  const scheduleLoaded = loadScheduleIndex();
   const loaded = await loadQuestions();
   if (!loaded) {
     showToast('질문을 불러오는데 실패했습니다', true);
@@ -369,7 +567,7 @@ async function init() {
   // Display content
   displayTodayDate();
   displayTodayQuestions();
-  displayPastQuestions();
+  displayPastQuestions(scheduleLoaded);
 
   // Setup
   hideKakaoOnDesktop();
@@ -0,0 +1,132 @@
+"""
+Build the chunked question schedule used by the web app's history view.
+
+Writes docs/data/schedule/index.json and chunk-NNNN.json files. Chunk N holds
+CHUNK_DAYS consecutive days starting at startDate + N * CHUNK_DAYS, one entry
+per day: {"daily": <id>, "special": <id>} or {"daily": <id>, "holiday": "MM-DD"}.
+
+Entries for days before today are kept from the existing files, so the history
+keeps showing what was actually sent even after the catalog changes. Re-run
+after editing questions.json.
+
+Usage:
+    python scripts/build_schedule.py [--days-ahead 400]
+"""
+
+import argparse
+import json
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.resolve()
+QUESTIONS_PATH = ROOT_DIR / "docs" / "data" / "questions.json"
+SCHEDULE_DIR = ROOT_DIR / "docs" / "data" / "schedule"
+DEFAULT_START_DATE = "2025-12-12"
+CHUNK_DAYS = 30
+DAYS_AHEAD = 400
+
+
+def chunk_filename(index: int) -> str:
+    return f"chunk-{index:04d}.json"
+
+
+def build_entry(questions: dict, start: date, offset: int) -> dict:
+    """Pick the questions for one day, same rotation as the bot (holiday first)."""
+    day = start + timedelta(days=offset)
+    entry = {}
+
+    daily = questions.get("questions", {}).get("daily", [])
+    if daily:
+        entry["daily"] = daily[offset % len(daily)]["id"]
+
+    mmdd = day.strftime("%m-%d")
+    if any(h.get("date") == mmdd for h in questions.get("holidays", [])):
+        entry["holiday"] = mmdd
+    else:
+        special = questions.get("questions", {}).get("special", [])
+        if special:
+            entry["special"] = special[offset % len(special)]["id"]
+
+    return entry
+
+
+def load_existing(schedule_dir: Path, start: date) -> list:
+    """Load the current schedule entries (empty if missing or built for another start date)."""
+    try:
+        with open(schedule_dir / "index.json", "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+    if index.get("startDate") != start.isoformat():
+        return []
+
+    entries = []
+    for i in range(index.get("chunks", 0)):
+        try:
+            with open(schedule_dir / chunk_filename(i), "r", encoding="utf-8") as f:
+                entries.extend(json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError):
+            break
+    return entries
+
+
+def build_schedule(questions: dict, start: date, today: date, days_ahead: int,
+                   existing: list = None) -> list:
+    """Build entries from start through today + days_ahead, keeping past days from existing."""
+    existing = existing or []
+    today_offset = (today - start).days
+    entries = []
+    for offset in range(max(0, today_offset + days_ahead + 1)):
+        if offset < today_offset and offset < len(existing):
+            entries.append(existing[offset])
+        else:
+            entries.append(build_entry(questions, start, offset))
+    return entries
+
+
+def write_schedule(schedule_dir: Path, entries: list, start: date, chunk_days: int = CHUNK_DAYS):
+    """Write index.json and the chunk files, removing chunks that are no longer used."""
+    schedule_dir.mkdir(parents=True, exist_ok=True)
+    chunks = [entries[i:i + chunk_days] for i in range(0, len(entries), chunk_days)]
+
+    for i, chunk in enumerate(chunks):
+        with open(schedule_dir / chunk_filename(i), "w", encoding="utf-8") as f:
+            json.dump(chunk, f, separators=(",", ":"))
+            f.write("\n")
+
+    for stale in schedule_dir.glob("chunk-*.json"):
+        if stale.name not in {chunk_filename(i) for i in range(len(chunks))}:
+            stale.unlink()
+
+    index = {
+        "startDate": start.isoformat(),
+        "chunkDays": chunk_days,
+        "chunks": len(chunks),
+        "days": len(entries),
+    }
+    with open(schedule_dir / "index.json", "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+        f.write("\n")
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Build the chunked question schedule")
+    parser.add_argument("--days-ahead", type=int, default=DAYS_AHEAD)
+    parser.add_argument("--questions", type=Path, default=QUESTIONS_PATH)
+    parser.add_argument("--out", type=Path, default=SCHEDULE_DIR)
+    args = parser.parse_args(argv)
+
+    with open(args.questions, "r", encoding="utf-8") as f:
+        questions = json.load(f)
+    start = datetime.strptime(
+        questions.get("config", {}).get("startDate", DEFAULT_START_DATE), "%Y-%m-%d"
+    ).date()
+
+    existing = load_existing(args.out, start)
+    entries = build_schedule(questions, start, date.today(), args.days_ahead, existing)
+    write_schedule(args.out, entries, start)
+    print(f"Wrote {len(entries)} days to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
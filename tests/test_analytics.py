@@ -0,0 +1,110 @@
+"""Tests for batched question copy analytics."""
+
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+# Add bot directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "bot"))
+
+
+class TestCopyAnalytics:
+    """Tests for CopyAnalytics."""
+
+    def test_record_does_not_touch_disk(self, tmp_path):
+        """Recording a tap should only update memory."""
+        from analytics import CopyAnalytics
+
+        store = tmp_path / "analytics.json"
+        analytics = CopyAnalytics(store)
+        analytics.record(1, "daily", date(2025, 12, 12))
+        analytics.record(1, "daily", date(2025, 12, 12))
+
+        assert analytics.pending == 1
+        assert not store.exists()
+
+    def test_flush_aggregates_into_store(self, tmp_path):
+        """Flush should merge counts with what is already stored."""
+        from analytics import CopyAnalytics
+
+        store = tmp_path / "analytics.json"
+        analytics = CopyAnalytics(store)
+        day = date(2025, 12, 12)
+
+        analytics.record(1, "daily", day)
+        analytics.record(1, "daily", day)
+        analytics.record(7, "special", day)
+        assert analytics.flush() == 3
+        assert analytics.pending == 0
+
+        analytics.record(1, "daily", day)
+        analytics.flush()
+
+        with open(store, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["copies"]["2025-12-12"] == {"daily": {"1": 3}, "special": {"7": 1}}
+
+    def test_flush_with_nothing_pending_skips_write(self, tmp_path):
+        """Flush without taps should not create the store."""
+        from analytics import CopyAnalytics
+
+        store = tmp_path / "analytics.json"
+        assert CopyAnalytics(store).flush() == 0
+        assert not store.exists()
+
+    def test_failed_flush_keeps_counts(self, tmp_path, monkeypatch):
+        """Counts should survive a failed write and go out with the next flush."""
+        import analytics as analytics_module
+        from analytics import CopyAnalytics
+
+        analytics = CopyAnalytics(tmp_path / "analytics.json")
+        analytics.record(1, "daily", date(2025, 12, 12))
+
+        def broken_save(data, path):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(analytics_module, "save_json_atomic", broken_save)
+        with pytest.raises(OSError):
+            analytics.flush()
+
+        assert analytics.pending == 1
+
+
+class TestBuildReport:
+    """Tests for build_report function."""
+
+    def test_totals_and_date_range(self):
+        """Report should sum per question, filter by date, most copied first."""
+        from analytics import build_report
+
+        data = {"copies": {
+            "2025-12-12": {"daily": {"1": 2}, "special": {"5": 1}},
+            "2025-12-13": {"daily": {"1": 1, "2": 4}},
+            "2025-12-14": {"daily": {"1": 10}},
+        }}
+        rows = build_report(data, since="2025-12-12", until="2025-12-13")
+
+        assert rows == [
+            {"kind": "daily", "question_id": 2, "copies": 4, "days": 1},
+            {"kind": "daily", "question_id": 1, "copies": 3, "days": 2},
+            {"kind": "special", "question_id": 5, "copies": 1, "days": 1},
+        ]
+
+    def test_cli_csv_export(self, tmp_path, capsys):
+        """report --csv should include question text from the catalog."""
+        import analytics
+
+        store = tmp_path / "analytics.json"
+        analytics.save_json_atomic({"copies": {"2025-12-12": {"daily": {"1": 2}}}}, store)
+        questions = tmp_path / "questions.json"
+        questions.write_text(json.dumps({"questions": {"daily": [{"id": 1, "text": "hello"}]}}),
+                             encoding="utf-8")
+
+        analytics.main(["report", "--csv", "--store", str(store), "--questions", str(questions)])
+
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert lines[0] == "kind,question_id,copies,days,text"
+        assert lines[1] == "daily,1,2,1,hello"
@@ -0,0 +1,199 @@
+"""Tests for per-chat concurrent update processing."""
+
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add bot directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "bot"))
+
+
+def make_update(update_id: int, chat_id: int):
+    """Build a minimal /start message update for a chat."""
+    from telegram import Chat, Message, Update
+
+    message = Message(
+        message_id=update_id,
+        date=datetime.now(),
+        chat=Chat(id=chat_id, type="private"),
+        text="/start",
+    )
+    return Update(update_id=update_id, message=message)
+
+
+async def process_all(processor, jobs):
+    """Feed (update, coroutine) pairs to the processor like Application does."""
+    async with processor:
+        tasks = [asyncio.create_task(processor.process_update(u, c)) for u, c in jobs]
+        await asyncio.gather(*tasks)
+
+
+class TestPerChatUpdateProcessor:
+    """Tests for PerChatUpdateProcessor."""
+
+    def test_same_chat_runs_in_order(self):
+        """Updates from one chat should never overlap and keep their order."""
+        from concurrency import PerChatUpdateProcessor
+
+        events = []
+
+        async def handler(name):
+            events.append(("start", name))
+            await asyncio.sleep(0.01)
+            events.append(("end", name))
+
+        processor = PerChatUpdateProcessor(max_concurrent_updates=8)
+        jobs = [(make_update(i, 1), handler(i)) for i in range(5)]
+        asyncio.run(process_all(processor, jobs))
+
+        expected = []
+        for i in range(5):
+            expected += [("start", i), ("end", i)]
+        assert events == expected
+        assert processor.active_chats == 0
+
+    def test_different_chats_run_concurrently(self):
+        """Updates from different chats should overlap."""
+        from concurrency import PerChatUpdateProcessor
+
+        running = 0
+        peak = 0
+
+        async def handler():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        processor = PerChatUpdateProcessor(max_concurrent_updates=8)
+        jobs = [(make_update(i, chat_id=i), handler()) for i in range(5)]
+        asyncio.run(process_all(processor, jobs))
+
+        assert peak == 5
+
+    def test_global_cap_is_respected(self):
+        """No more than max_concurrent_updates handlers should run at once."""
+        from concurrency import PerChatUpdateProcessor
+
+        running = 0
+        peak = 0
+
+        async def handler():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        processor = PerChatUpdateProcessor(max_concurrent_updates=3)
+        jobs = [(make_update(i, chat_id=i), handler()) for i in range(10)]
+        asyncio.run(process_all(processor, jobs))
+
+        assert peak == 3
+
+    def test_busy_chat_does_not_starve_others(self):
+        """A chat flooding the bot should not hold slots other chats need."""
+        from concurrency import PerChatUpdateProcessor
+
+        finished = []
+
+        async def handler(name, delay):
+            await asyncio.sleep(delay)
+            finished.append(name)
+
+        processor = PerChatUpdateProcessor(max_concurrent_updates=2)
+        jobs = [(make_update(i, chat_id=1), handler(f"busy{i}", 0.02)) for i in range(4)]
+        jobs.append((make_update(99, chat_id=2), handler("other", 0.001)))
+        asyncio.run(process_all(processor, jobs))
+
+        assert finished[0] == "other"
+
+    def test_flooding_chat_cannot_fill_pending_slots(self):
+        """Updates past the per-chat limit should be dropped, leaving room for others."""
+        from concurrency import PerChatUpdateProcessor
+
+        handled = []
+
+        async def handler(name):
+            await asyncio.sleep(0.01)
+            handled.append(name)
+
+        processor = PerChatUpdateProcessor(
+            max_concurrent_updates=2, max_pending_updates=4, max_updates_per_chat=2
+        )
+        jobs = [(make_update(i, chat_id=1), handler(f"flood{i}")) for i in range(10)]
+        jobs.append((make_update(99, chat_id=2), handler("other")))
+        asyncio.run(process_all(processor, jobs))
+
+        assert handled.index("other") < handled.index("flood1")
+        assert sorted(handled) == ["flood0", "flood1", "other"]
+        assert processor.active_chats == 0
+
+    def test_shared_handler_slots_cap_all_processors(self):
+        """Processors sharing handler slots should respect one cap together."""
+        from concurrency import PerChatUpdateProcessor
+
+        running = 0
+        peak = 0
+
+        async def handler():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        async def run():
+            slots = asyncio.Semaphore(2)
+            processors = [PerChatUpdateProcessor(8, handler_slots=slots) for _ in range(3)]
+            await asyncio.gather(*(
+                process_all(p, [(make_update(i, chat_id=i), handler()) for i in range(4)])
+                for p in processors
+            ))
+
+        asyncio.run(run())
+
+        assert peak == 2
+
+    def test_rejects_invalid_limits(self):
+        """Non-positive or inconsistent limits should raise ValueError."""
+        from concurrency import PerChatUpdateProcessor
+
+        with pytest.raises(ValueError):
+            PerChatUpdateProcessor(max_concurrent_updates=0, max_pending_updates=4)
+        with pytest.raises(ValueError):
+            PerChatUpdateProcessor(max_concurrent_updates=8, max_pending_updates=4)
+        with pytest.raises(ValueError):
+            PerChatUpdateProcessor(max_concurrent_updates=2, max_updates_per_chat=0)
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_spaces_out_calls(self):
+        """Calls should be spread at the configured rate."""
+        from concurrency import RateLimiter
+
+        limiter = RateLimiter(rate=100)
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+            return loop.time() - started
+
+        elapsed = asyncio.run(run())
+
+        # First call is immediate, the other five wait 10ms each
+        assert elapsed >= 0.045
+
+    def test_rejects_non_positive_rate(self):
+        """A zero rate should raise ValueError."""
+        from concurrency import RateLimiter
+
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
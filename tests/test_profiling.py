@@ -0,0 +1,129 @@
+"""Tests for on-demand profiling sessions."""
+
+import asyncio
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Add bot directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "bot"))
+
+
+class TestProfiler:
+    """Tests for Profiler."""
+
+    def test_session_writes_report(self, tmp_path):
+        """A manual session should write a .prof dump and a text report."""
+        from profiling import Profiler
+
+        profiler = Profiler(tmp_path, lag_interval=0.005)
+
+        async def run():
+            assert profiler.start() is True
+            assert profiler.start() is False
+            await asyncio.sleep(0.05)
+            return profiler.stop()
+
+        report = asyncio.run(run())
+
+        assert report.exists()
+        assert report.with_suffix(".prof").exists()
+        text = report.read_text(encoding="utf-8")
+        assert "== CPU (cumulative) ==" in text
+        assert "== Memory (tracemalloc diff) ==" in text
+        assert "== Event loop lag ==" in text
+        assert "== Asyncio tasks" in text
+        assert not profiler.active
+        assert not tracemalloc.is_tracing()
+
+    def test_timed_session_stops_itself(self, tmp_path):
+        """A session started with seconds should stop on its own."""
+        from profiling import Profiler
+
+        profiler = Profiler(tmp_path)
+
+        async def run():
+            profiler.start(seconds=0.02)
+            await asyncio.sleep(0.1)
+
+        asyncio.run(run())
+
+        assert not profiler.active
+        assert len(list(tmp_path.glob("*.txt"))) == 1
+
+    def test_broadcast_not_profiled_unless_armed(self, tmp_path):
+        """broadcast() should do nothing when not armed."""
+        from profiling import Profiler
+
+        profiler = Profiler(tmp_path / "profiles")
+
+        async def run():
+            async with profiler.broadcast():
+                assert not profiler.active
+
+        asyncio.run(run())
+
+        assert not (tmp_path / "profiles").exists()
+
+    def test_armed_broadcast_profiled_once(self, tmp_path):
+        """An armed broadcast should be profiled, and only the next one."""
+        from profiling import Profiler
+
+        profiler = Profiler(tmp_path)
+        profiler.arm_next_broadcast()
+
+        async def run():
+            async with profiler.broadcast():
+                assert profiler.active
+            async with profiler.broadcast():
+                assert not profiler.active
+
+        asyncio.run(run())
+
+        assert not profiler.armed_for_broadcast
+        reports = list(tmp_path.glob("*-broadcast.txt"))
+        assert len(reports) == 1
+
+
+class TestProfileCommand:
+    """Tests for the /profile admin command."""
+
+    def run_command(self, monkeypatch, tmp_path, args):
+        """Run /profile as an admin and return the reply text."""
+        from types import SimpleNamespace
+
+        import main
+        from profiling import Profiler
+
+        replies = []
+
+        async def reply_text(text, parse_mode=None):
+            replies.append(text)
+
+        monkeypatch.setattr(main, "profiler", Profiler(tmp_path))
+        monkeypatch.setattr(main.config, "ADMIN_CHAT_IDS", {1})
+        update = SimpleNamespace(
+            effective_chat=SimpleNamespace(id=1),
+            message=SimpleNamespace(reply_text=reply_text),
+        )
+        context = SimpleNamespace(args=args)
+
+        async def run():
+            await main.profile_command(update, context)
+            main.profiler.stop()
+
+        asyncio.run(run())
+        return replies[0]
+
+    def test_rejects_zero_and_unknown_arguments(self, monkeypatch, tmp_path):
+        """/profile 0 and unknown words should reply with usage, not start a session."""
+        for args in (["0"], ["soon"], ["-5"]):
+            reply = self.run_command(monkeypatch, tmp_path, args)
+            assert reply.startswith("Usage:")
+        assert not list(tmp_path.glob("*.txt"))
+
+    def test_starts_timed_session(self, monkeypatch, tmp_path):
+        """/profile N should start an N second session."""
+        reply = self.run_command(monkeypatch, tmp_path, ["5"])
+
+        assert reply == "Profiling for 5s."
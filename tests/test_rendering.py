@@ -0,0 +1,135 @@
+"""Tests for question validation and MarkdownV2 rendering."""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add bot directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "bot"))
+
+MARKDOWN_V2_SPECIAL = "_*[]()~`>#+-=|{}.!"
+
+
+def assert_escaped(text: str):
+    """Every MarkdownV2 special character in plain text must be escaped."""
+    for i, char in enumerate(text):
+        if char in MARKDOWN_V2_SPECIAL:
+            assert i > 0 and text[i - 1] == "\\", f"unescaped {char!r} in {text!r}"
+
+
+class TestRenderQuestions:
+    """Tests for render_questions function."""
+
+    def test_escapes_markdown_characters(self):
+        """Question text with markdown characters should be escaped."""
+        import main
+
+        data = {"questions": {"daily": [{"id": 1, "text": "snake_case *bold* `code` 1.5!"}]}}
+        questions = main.render_questions(data)
+
+        rendered = questions["daily"][0]["markdown"]
+        assert rendered.startswith("_") and rendered.endswith("_")
+        assert_escaped(rendered[1:-1])
+        assert questions["daily"][0]["text"] == "snake_case *bold* `code` 1.5!"
+
+    def test_rejects_invalid_entries(self):
+        """Entries without id or text, and duplicate ids, should be dropped."""
+        import main
+
+        data = {
+            "questions": {
+                "daily": [
+                    {"id": 1, "text": "ok"},
+                    {"id": 1, "text": "duplicate"},
+                    {"id": 2, "text": "   "},
+                    {"id": "3", "text": "string id"},
+                    {"text": "no id"},
+                    "not a dict",
+                    {"id": 4, "text": "x" * (main.MAX_QUESTION_LENGTH + 1)},
+                ],
+                "special": [{"id": 5, "text": "special", "theme": "past"}],
+            },
+            "holidays": [
+                {"date": "01-01", "name": "새해", "question": "ok"},
+                {"date": "13-01", "name": "bad", "question": "bad date"},
+                {"date": "05-05", "name": "empty"},
+            ],
+        }
+        questions = main.render_questions(data)
+
+        assert [q["id"] for q in questions["daily"]] == [1]
+        assert [q["id"] for q in questions["special"]] == [5]
+        assert [h["date"] for h in questions["holidays"]] == ["01-01"]
+
+    def test_bundled_catalog_renders_completely(self):
+        """Every question in the shipped catalog should pass validation."""
+        import main
+
+        with open(main.config.DEFAULT_QUESTIONS_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        questions = main.render_questions(data)
+
+        assert len(questions["daily"]) == len(data["questions"]["daily"])
+        assert len(questions["special"]) == len(data["questions"]["special"])
+        assert len(questions["holidays"]) == len(data["holidays"])
+
+
+class TestLoadQuestionsCache:
+    """Tests for the rendered catalog cache."""
+
+    def test_reuses_rendered_catalog_until_file_changes(self, monkeypatch, tmp_path):
+        """load_questions should only re-render when the file changes."""
+        import main
+
+        path = tmp_path / "questions.json"
+        path.write_text(json.dumps({"questions": {"daily": [{"id": 1, "text": "a"}]}}),
+                        encoding="utf-8")
+        monkeypatch.setattr(main, "QUESTIONS_PATH", path)
+
+        first = main.load_questions()
+        assert main.load_questions() is first
+
+        path.write_text(json.dumps({"questions": {"daily": [{"id": 2, "text": "bb"}]}}),
+                        encoding="utf-8")
+        second = main.load_questions()
+        assert second is not first
+        assert second["daily"][0]["id"] == 2
+
+
+class TestFormatTodayMessage:
+    """Tests for format_today_message function."""
+
+    def test_uses_escaped_markdown(self):
+        """Question text should never break MarkdownV2 formatting."""
+        import main
+
+        questions = main.render_questions({
+            "questions": {
+                "daily": [{"id": 1, "text": "What's your_favorite *food*?"}],
+                "special": [{"id": 2, "text": "[link](x) 2.0", "theme": "past"}],
+            }
+        })
+        date = datetime(2025, 12, 12)
+        message = main.format_today_message(
+            main.get_daily_question(questions, date),
+            main.get_special_question(questions, date),
+        )
+
+        assert "*일상 질문*" in message
+        assert "\\(과거\\)" in message
+        assert "your\\_favorite \\*food\\*" in message
+        assert "\\[link\\]\\(x\\) 2\\.0" in message
+
+    def test_holiday_uses_rendered_question(self):
+        """Holiday questions should carry their pre-rendered form."""
+        import main
+
+        questions = main.render_questions({
+            "questions": {"daily": [{"id": 1, "text": "a"}]},
+            "holidays": [{"date": "12-25", "name": "크리스마스", "question": "Merry X-mas!"}],
+        })
+        special = main.get_special_question(questions, datetime(2025, 12, 25))
+
+        assert special["markdown"] == "_Merry X\\-mas\\!_"
+        assert special["markdown"] in main.format_today_message(None, special)
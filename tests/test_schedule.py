@@ -0,0 +1,74 @@
+"""Tests for the precomputed question schedule used by the web history."""
+
+import json
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+START = date(2025, 12, 12)
+QUESTIONS = {
+    "questions": {
+        "daily": [{"id": 1, "text": "d1"}, {"id": 2, "text": "d2"}, {"id": 3, "text": "d3"}],
+        "special": [{"id": 10, "text": "s10"}, {"id": 11, "text": "s11"}],
+    },
+    "holidays": [{"date": "12-25", "name": "크리스마스", "question": "h"}],
+}
+
+
+class TestBuildSchedule:
+    """Tests for build_schedule function."""
+
+    def test_rotation_and_holidays(self):
+        """Days should rotate like the bot, with holidays replacing special questions."""
+        from build_schedule import build_schedule
+
+        entries = build_schedule(QUESTIONS, START, today=START, days_ahead=13)
+
+        assert len(entries) == 14
+        assert [e["daily"] for e in entries[:4]] == [1, 2, 3, 1]
+        assert [e["special"] for e in entries[:3]] == [10, 11, 10]
+        assert entries[13] == {"daily": 2, "holiday": "12-25"}
+
+    def test_past_days_are_kept(self):
+        """Entries before today should survive a catalog change; today onward is rebuilt."""
+        from build_schedule import build_schedule
+
+        today = START + timedelta(days=5)
+        existing = build_schedule(QUESTIONS, START, today=today, days_ahead=5)
+
+        changed = json.loads(json.dumps(QUESTIONS))
+        changed["questions"]["daily"].insert(0, {"id": 99, "text": "new"})
+        entries = build_schedule(changed, START, today=today, days_ahead=5, existing=existing)
+
+        assert entries[:5] == existing[:5]
+        assert entries[5]["daily"] == [99, 1, 2, 3][5 % 4]
+
+
+class TestWriteSchedule:
+    """Tests for write_schedule and load_existing functions."""
+
+    def test_chunks_round_trip(self, tmp_path):
+        """Written chunks should load back into the same entries, stale chunks removed."""
+        from build_schedule import build_schedule, load_existing, write_schedule
+
+        (tmp_path / "chunk-0099.json").write_text("[]", encoding="utf-8")
+        entries = build_schedule(QUESTIONS, START, today=START, days_ahead=24)
+        write_schedule(tmp_path, entries, START, chunk_days=10)
+
+        index = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))
+        assert index == {"startDate": "2025-12-12", "chunkDays": 10, "chunks": 3, "days": 25}
+        assert sorted(p.name for p in tmp_path.glob("chunk-*.json")) == [
+            "chunk-0000.json", "chunk-0001.json", "chunk-0002.json"
+        ]
+        assert load_existing(tmp_path, START) == entries
+
+    def test_other_start_date_is_ignored(self, tmp_path):
+        """A schedule built for another start date should not be reused."""
+        from build_schedule import build_schedule, load_existing, write_schedule
+
+        write_schedule(tmp_path, build_schedule(QUESTIONS, START, START, 3), START)
+
+        assert load_existing(tmp_path, START + timedelta(days=1)) == []
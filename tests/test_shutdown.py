@@ -0,0 +1,206 @@
+"""Tests for broadcast checkpointing, draining and resume."""
+
+import asyncio
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add bot directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "bot"))
+
+
+class SlowBot:
+    """Bot stand-in that takes a while per message and records chat ids."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = []
+
+    async def send_message(self, chat_id, text, parse_mode, reply_markup):
+        await asyncio.sleep(self.delay)
+        self.sent.append(chat_id)
+
+
+class FailingBot:
+    """Bot stand-in whose sends always fail with a retryable error."""
+
+    def __init__(self):
+        self.attempts = 0
+
+    async def send_message(self, chat_id, text, parse_mode, reply_markup):
+        self.attempts += 1
+        raise RuntimeError("network down")
+
+
+@pytest.fixture
+def tenant_app(tmp_path, monkeypatch):
+    """A single bot with five subscribers and no send rate limit."""
+    import main
+    from concurrency import RateLimiter
+
+    monkeypatch.setattr(main, "broadcast_limiter", RateLimiter(rate=100000))
+    main.stop_broadcasts.clear()
+
+    tenant = {
+        "name": "test",
+        "web_url": "https://example.com/",
+        "subscribers_path": tmp_path / "subscribers.json",
+        "broadcast_path": tmp_path / "broadcast.json",
+    }
+    for chat_id in range(1, 6):
+        main.add_subscriber(chat_id, f"user{chat_id}", tenant["subscribers_path"])
+
+    yield SimpleNamespace(bot=SlowBot(), bot_data={"tenant": tenant})
+    main.stop_broadcasts.clear()
+
+
+def read_checkpoint(app) -> dict:
+    with open(app.bot_data["tenant"]["broadcast_path"], "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class TestBroadcastCheckpoint:
+    """Tests for send_daily_notification checkpointing."""
+
+    def test_completed_broadcast_is_not_repeated(self, tenant_app):
+        """A finished broadcast should be marked done and not sent again today."""
+        import main
+
+        asyncio.run(main.send_daily_notification(tenant_app))
+        asyncio.run(main.send_daily_notification(tenant_app))
+
+        assert tenant_app.bot.sent == [1, 2, 3, 4, 5]
+        state = read_checkpoint(tenant_app)
+        assert state["status"] == "done"
+        assert state["sent"] == 5
+        assert state["pending"] == []
+        assert not main.has_interrupted_broadcast(tenant_app.bot_data["tenant"])
+
+    def test_drain_checkpoints_and_resume_continues(self, tenant_app):
+        """Draining past the deadline should checkpoint; the next run sends the rest."""
+        import main
+
+        tenant_app.bot.delay = 0.02
+
+        async def interrupt():
+            task = asyncio.create_task(main.send_daily_notification(tenant_app))
+            await asyncio.sleep(0.03)
+            await main.drain_broadcasts(deadline=0.01)
+            assert task.done()
+
+        asyncio.run(interrupt())
+
+        first_run = list(tenant_app.bot.sent)
+        state = read_checkpoint(tenant_app)
+        assert state["status"] == "interrupted"
+        assert 0 < len(first_run) < 5
+        assert state["pending"] == [c for c in [1, 2, 3, 4, 5] if c not in first_run]
+        assert main.has_interrupted_broadcast(tenant_app.bot_data["tenant"])
+
+        main.stop_broadcasts.clear()
+        tenant_app.bot.delay = 0
+        asyncio.run(main.send_daily_notification(tenant_app))
+
+        assert sorted(tenant_app.bot.sent) == [1, 2, 3, 4, 5]
+        assert read_checkpoint(tenant_app)["status"] == "done"
+
+    def test_drain_waits_for_broadcast_within_deadline(self, tenant_app):
+        """A broadcast that finishes before the deadline should not be cut off."""
+        import main
+
+        tenant_app.bot.delay = 0.005
+
+        async def drain():
+            task = asyncio.create_task(main.send_daily_notification(tenant_app))
+            await asyncio.sleep(0)
+            await main.drain_broadcasts(deadline=5)
+            assert task.done()
+
+        asyncio.run(drain())
+
+        assert tenant_app.bot.sent == [1, 2, 3, 4, 5]
+        assert not main.stop_broadcasts.is_set()
+
+    def test_drain_cancels_broadcast_stuck_in_send(self, tenant_app):
+        """A send that never returns should be cancelled after the stop timeout."""
+        import main
+
+        tenant_app.bot.delay = 60
+
+        async def interrupt():
+            loop = asyncio.get_running_loop()
+            task = asyncio.create_task(main.send_daily_notification(tenant_app))
+            await asyncio.sleep(0.01)
+            started = loop.time()
+            await main.drain_broadcasts(deadline=0.01, stop_timeout=0.01)
+            assert task.cancelled()
+            return loop.time() - started
+
+        assert asyncio.run(interrupt()) < 1
+        state = read_checkpoint(tenant_app)
+        assert state["status"] == "interrupted"
+        assert state["pending"] == [1, 2, 3, 4, 5]
+
+    def test_stop_interrupts_retry_backoff(self, tenant_app):
+        """Stopping during a retry backoff should leave the chat pending, not failed."""
+        import main
+
+        tenant_app.bot = FailingBot()
+
+        async def interrupt():
+            loop = asyncio.get_running_loop()
+            task = asyncio.create_task(main.send_daily_notification(tenant_app))
+            await asyncio.sleep(0.05)
+            started = loop.time()
+            await main.drain_broadcasts(deadline=0.01, stop_timeout=5)
+            assert task.done() and not task.cancelled()
+            return loop.time() - started
+
+        assert asyncio.run(interrupt()) < 1
+        assert tenant_app.bot.attempts == 1
+        state = read_checkpoint(tenant_app)
+        assert state["status"] == "interrupted"
+        assert state["failed"] == 0
+        assert state["pending"] == [1, 2, 3, 4, 5]
+
+    def test_resume_skips_unsubscribed_chats(self, tenant_app):
+        """Chats that unsubscribed since the interruption should not be messaged."""
+        import main
+
+        tenant = tenant_app.bot_data["tenant"]
+        main.save_json_atomic({
+            "date": datetime.now().strftime("%Y-%m-%d"),
+            "status": "interrupted",
+            "pending": [3, 4, 5],
+            "sent": 2,
+            "failed": 0,
+        }, tenant["broadcast_path"])
+        main.remove_subscriber(4, tenant["subscribers_path"])
+
+        asyncio.run(main.send_daily_notification(tenant_app))
+
+        assert tenant_app.bot.sent == [3, 5]
+        assert read_checkpoint(tenant_app)["sent"] == 4
+
+    def test_stale_checkpoint_starts_fresh(self, tenant_app):
+        """An interrupted broadcast from another day should not be resumed."""
+        import main
+
+        tenant = tenant_app.bot_data["tenant"]
+        yesterday = datetime.now() - timedelta(days=1)
+        main.save_json_atomic({
+            "date": yesterday.strftime("%Y-%m-%d"),
+            "status": "interrupted",
+            "pending": [5],
+            "sent": 4,
+            "failed": 0,
+        }, tenant["broadcast_path"])
+
+        assert not main.has_interrupted_broadcast(tenant)
+        asyncio.run(main.send_daily_notification(tenant_app))
+
+        assert tenant_app.bot.sent == [1, 2, 3, 4, 5]
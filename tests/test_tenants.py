@@ -0,0 +1,171 @@
+"""Tests for hosting several bots in one process."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add bot directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "bot"))
+
+
+class FakeBot:
+    """Bot stand-in that records sent messages."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, chat_id, text, parse_mode, reply_markup):
+        self.sent.append((chat_id, text, reply_markup))
+
+
+def make_tenant(tmp_path: Path, name: str) -> dict:
+    return {
+        "name": name,
+        "token": f"123:{name}",
+        "web_url": f"https://example.com/{name}/",
+        "subscribers_path": tmp_path / name / "subscribers.json",
+        "analytics_path": tmp_path / name / "analytics.json",
+        "broadcast_path": tmp_path / name / "broadcast.json",
+        "notification_hour": 19,
+        "notification_minute": 0,
+    }
+
+
+class TestLoadTenants:
+    """Tests for config.load_tenants function."""
+
+    def test_single_bot_without_config(self, monkeypatch):
+        """Without BOTS_CONFIG the process runs one bot from BOT_TOKEN."""
+        import config
+
+        monkeypatch.setattr(config, "BOTS_CONFIG_PATH", None)
+        tenants = config.load_tenants()
+
+        assert len(tenants) == 1
+        assert tenants[0]["token"] == config.BOT_TOKEN
+        assert tenants[0]["subscribers_path"] == config.SUBSCRIBERS_JSON_PATH
+
+    def test_loads_bots_from_config(self, monkeypatch, tmp_path):
+        """Each configured bot gets its token and its own data namespace."""
+        import config
+
+        bots_config = tmp_path / "bots.json"
+        bots_config.write_text(json.dumps([
+            {"name": "ko", "token_env": "TEST_TOKEN_KO"},
+            {"name": "en", "token_env": "TEST_TOKEN_EN", "notification_hour": 20},
+        ]), encoding="utf-8")
+        monkeypatch.setattr(config, "BOTS_CONFIG_PATH", str(bots_config))
+        monkeypatch.setenv("TEST_TOKEN_KO", "1:ko")
+        monkeypatch.setenv("TEST_TOKEN_EN", "2:en")
+
+        tenants = config.load_tenants()
+
+        assert [t["token"] for t in tenants] == ["1:ko", "2:en"]
+        assert tenants[0]["subscribers_path"] != tenants[1]["subscribers_path"]
+        assert tenants[1]["notification_hour"] == 20
+
+    def test_rejects_missing_token_and_duplicates(self, monkeypatch, tmp_path):
+        """Unset tokens, duplicate names and duplicate tokens should raise ValueError."""
+        import config
+
+        bots_config = tmp_path / "bots.json"
+        monkeypatch.setattr(config, "BOTS_CONFIG_PATH", str(bots_config))
+        monkeypatch.setenv("TEST_TOKEN_KO", "1:ko")
+
+        bots_config.write_text(json.dumps([{"name": "ko", "token_env": "TEST_TOKEN_UNSET"}]),
+                               encoding="utf-8")
+        with pytest.raises(ValueError):
+            config.load_tenants()
+
+        bots_config.write_text(json.dumps([
+            {"name": "ko", "token_env": "TEST_TOKEN_KO"},
+            {"name": "ko", "token_env": "TEST_TOKEN_KO"},
+        ]), encoding="utf-8")
+        with pytest.raises(ValueError):
+            config.load_tenants()
+
+        bots_config.write_text(json.dumps([
+            {"name": "ko", "token_env": "TEST_TOKEN_KO"},
+            {"name": "en", "token_env": "TEST_TOKEN_KO"},
+        ]), encoding="utf-8")
+        with pytest.raises(ValueError, match="same token"):
+            config.load_tenants()
+
+        monkeypatch.setenv("TEST_TOKEN_EN", "1:ko")
+        bots_config.write_text(json.dumps([
+            {"name": "ko", "token_env": "TEST_TOKEN_KO"},
+            {"name": "en", "token_env": "TEST_TOKEN_EN"},
+        ]), encoding="utf-8")
+        with pytest.raises(ValueError, match="same token"):
+            config.load_tenants()
+
+
+class TestMultipleBots:
+    """Tests for per-bot namespaces with shared catalog."""
+
+    def test_applications_keep_separate_state(self, tmp_path):
+        """Each Application should carry its own tenant and analytics."""
+        import main
+
+        first = main.build_application(make_tenant(tmp_path, "a"))
+        second = main.build_application(make_tenant(tmp_path, "b"))
+
+        assert first.bot_data["tenant"]["name"] == "a"
+        assert second.bot_data["tenant"]["name"] == "b"
+        assert first.bot_data["analytics"] is not second.bot_data["analytics"]
+
+    def test_welcome_uses_own_notification_time(self, tmp_path):
+        """The /start welcome should announce the bot's own broadcast time."""
+        import main
+
+        tenant = make_tenant(tmp_path, "a")
+        tenant["notification_hour"], tenant["notification_minute"] = 8, 30
+        replies = []
+
+        async def reply_text(text, **kwargs):
+            replies.append(text)
+
+        update = SimpleNamespace(
+            effective_user=SimpleNamespace(username="one", first_name="One"),
+            effective_chat=SimpleNamespace(id=1),
+            message=SimpleNamespace(reply_text=reply_text),
+        )
+        asyncio.run(main.start_command(update, SimpleNamespace(bot_data={"tenant": tenant})))
+
+        assert "매일 아침 8시 30분," in replies[0]
+        assert "저녁 7시" not in replies[0]
+
+    def test_format_notification_time(self):
+        """Hours should read as a Korean time of day."""
+        import main
+
+        assert main.format_notification_time(19, 0) == "저녁 7시"
+        assert main.format_notification_time(12, 5) == "낮 12시 5분"
+        assert main.format_notification_time(0, 0) == "새벽 12시"
+
+    def test_broadcast_reaches_only_own_subscribers(self, tmp_path):
+        """Each bot's broadcast should use its own subscribers and web url."""
+        import main
+
+        tenants = [make_tenant(tmp_path, "a"), make_tenant(tmp_path, "b")]
+        main.add_subscriber(1, "one", tenants[0]["subscribers_path"])
+        main.add_subscriber(2, "two", tenants[1]["subscribers_path"])
+        main.add_subscriber(3, "three", tenants[1]["subscribers_path"])
+
+        apps = [SimpleNamespace(bot=FakeBot(), bot_data={"tenant": t}) for t in tenants]
+
+        async def run():
+            await asyncio.gather(*(main.send_daily_notification(app) for app in apps))
+
+        asyncio.run(run())
+
+        assert [chat_id for chat_id, _, _ in apps[0].bot.sent] == [1]
+        assert [chat_id for chat_id, _, _ in apps[1].bot.sent] == [2, 3]
+        # Same rendered message object shared across bots
+        assert apps[0].bot.sent[0][1] is apps[1].bot.sent[0][1]
+        web_button = apps[1].bot.sent[0][2].inline_keyboard[1][0]
+        assert web_button.url == "https://example.com/b/"